@@ -602,6 +602,39 @@ def rotationMatrix(angle,axis=None,angle_spec=DEG):
     return array(f)
 
 
+def rotationMatrices(angle,axis,angle_spec=DEG):
+    """Return a set of rotation matrices over angles around axes.
+
+    This is a vectorized version of :func:`rotationMatrix` for rotations
+    around arbitrary axes through the origin.
+
+    Parameters:
+
+    - `angle`: float or array_like (n,): the rotation angles, in degrees
+      unless angle_spec=RAD is specified.
+    - `axis`: array_like (3,) or (n,3): vectors along the rotation axes.
+
+    Returns a float array with shape (n,3,3), where the matrix ``[i]`` is
+    equal to ``rotationMatrix(angle[i],axis[i])``. A single angle or axis
+    is used for all the matrices.
+
+    >>> R = rotationMatrices([30.,45.],[[0.,1.,0.],[1.,1.,0.]])
+    >>> R.shape
+    (2, 3, 3)
+    >>> allclose(R[1],rotationMatrix(45.,[1.,1.,0.]))
+    True
+    """
+    a = asarray(angle).reshape(-1) * angle_spec
+    axis = normalize(asarray(axis, dtype=Float).reshape(-1, 3))
+    c, s, X, Y, Z = broadcast_arrays(cos(a), sin(a), *axis.T)
+    t = 1.-c
+    f = [ [ t*X*X + c, t*X*Y + s*Z, t*X*Z - s*Y ],
+          [ t*Y*X - s*Z, t*Y*Y + c, t*Y*Z + s*X ],
+          [ t*Z*X + s*Y, t*Z*Y - s*X, t*Z*Z + c   ] ]
+
+    return array(f).transpose(2, 0, 1)
+
+
 def rotmat(x):
     """Create a rotation matrix defined by 3 points in space.
 
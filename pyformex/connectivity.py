@@ -634,8 +634,8 @@ class Connectivity(ndarray):
           >>> Connectivity([[0,1,2],[0,1,4],[0,4,2]]).nParents()
           array([3, 2, 2, 0, 2])
         """
-        r = self.inverse()
-        return (r>=0).sum(axis=1)
+        # Counting the node occurrences does not need the inverse index
+        return bincount(self.ravel())
 
 
     def connectedTo(self,nodes,return_ncon=False):
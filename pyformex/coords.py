@@ -1042,7 +1042,7 @@ class Coords(ndarray):
         return self.translate(point-self.bboxPoint(alignment))
 
 
-    def rotate(self,angle,axis=2,around=None):
+    def rotate(self,angle,axis=2,around=None,inplace=False):
         """Returns a copy rotated over angle around axis.
 
         The angle is specified in degrees.
@@ -1056,6 +1056,7 @@ class Coords(ndarray):
 
         All rotations are performed around the point [0.,0.,0.], unless a
         rotation origin is specified in the argument 'around'.
+        If `inplace` is True, the coordinates are changed inplace.
         """
         mat = asarray(angle)
         if mat.size == 1:
@@ -1064,10 +1065,10 @@ class Coords(ndarray):
             raise ValueError("Rotation matrix should be 3x3")
         if around is not None:
             around = asarray(around)
-            out = self.translate(-around)
+            out = self.translate(-around, inplace=inplace)
         else:
             out = self
-        return out.affine(mat, around)
+        return out.affine(mat, around, inplace=inplace)
 
 
     def shear(self,dir,dir1,skew,inplace=False):
@@ -1104,19 +1105,27 @@ class Coords(ndarray):
         return out
 
 
-    def affine(self,mat,vec=None):
+    def affine(self,mat,vec=None,inplace=False):
         """Perform a general affine transformation.
 
         Parameters:
 
         - `mat`: a 3x3 float matrix
         - `vec`: a length 3 list or array of floats
+        - `inplace`: boolean: change the coordinates inplace (default False)
 
         The returned object has coordinates given by ``self * mat + vec``.
         If `mat` is a rotation matrix, than the operation performs a
         rigid rotation of the object plus a translation.
         """
-        out = dot(self, mat)
+        # Use a matrix of the same type as the coordinates: mixing
+        # float32 and float64 would make dot upcast all coordinates
+        mat = asarray(mat, dtype=self.dtype)
+        if inplace:
+            out = self
+            out[...] = dot(self, mat)
+        else:
+            out = dot(self, mat)
         if vec is not None:
             out += vec
         return out
@@ -1185,7 +1194,7 @@ class Coords(ndarray):
         """
         # We put in a optional scaling, because doing this together with the
         # transforming is cheaper than first scaling and then transforming.
-        f = zeros_like(self)
+        f = empty_like(self)
         theta = (scale[1]*angle_spec) * self[..., dir[1]]
         r = scale[0] * self[..., dir[0]]
         f[..., 0] = r*cos(theta)
@@ -1199,7 +1208,7 @@ class Coords(ndarray):
             rfunc = lambda x:1
         if zfunc is None:
             zfunc = lambda x:1
-        f = zeros_like(self)
+        f = empty_like(self)
         theta = (scale[1]*angle_spec) * self[..., dir[1]]
         r = scale[0] * rfunc(theta) * self[..., dir[0]]
         f[..., 0] = r * cos(theta)
@@ -1219,7 +1228,7 @@ class Coords(ndarray):
 
         The angle value is given in degrees.
         """
-        f = zeros_like(self)
+        f = empty_like(self)
         x, y, z = [ self[..., i] for i in dir ]
         f[..., 0] = sqrt(x*x+y*y)
         f[..., 1] = arctand2(y, x, angle_spec)
@@ -1242,15 +1251,17 @@ class Coords(ndarray):
 
         If colat=True, the third coordinate is the colatitude (90-lat) instead.
         """
-        f = self.reshape((-1, 3))
-        theta = (scale[0]*angle_spec) * f[:, dir[0]]
-        phi = (scale[1]*angle_spec) * f[:, dir[1]]
-        r = scale[2] * f[:, dir[2]]
+        f = empty_like(self)
+        theta = (scale[0]*angle_spec) * self[..., dir[0]]
+        phi = (scale[1]*angle_spec) * self[..., dir[1]]
+        r = scale[2] * self[..., dir[2]]
         if colat:
             phi = 90.0*angle_spec - phi
         rc = r*cos(phi)
-        f = column_stack([rc*cos(theta), rc*sin(theta), r*sin(phi)])
-        return f.reshape(self.shape)
+        f[..., 0] = rc*cos(theta)
+        f[..., 1] = rc*sin(theta)
+        f[..., 2] = r*sin(phi)
+        return f
 
 
     def superSpherical(self,n=1.0,e=1.0,k=0.0, dir=[0, 1, 2],scale=[1., 1., 1.],angle_spec=DEG,colat=False):
@@ -1409,25 +1420,27 @@ class Coords(ndarray):
         return f
 
 
-    def flare (self,xf,f,dir=[0, 2],end=0,exp=1.):
+    def flare (self,xf,f,dir=[0, 2],end=0,exp=1.,inplace=False):
         """Create a flare at the end of a :class:`Coords` block.
 
         The flare extends over a distance ``xf`` at the start (``end=0``)
         or end (``end=1``) in direction ``dir[0]`` of the coords block,
         and has a maximum amplitude of ``f`` in the ``dir[1]`` direction.
+        If `inplace` is True, the coordinates are changed inplace.
         """
         ix, iz = dir
-        bb = self.bbox()
+        xi = self[..., ix]
+        # relative distance from the end, positive inside the flare
         if end == 0:
-            xmin = bb[0][ix]
-            endx = self.test(dir=ix, max=xmin+xf)
-            func = lambda x: (1.-(x-xmin)/xf) ** exp
+            t = 1. - (xi - xi.min()) / xf
+        else:
+            t = 1. - (xi.max() - xi) / xf
+        t = t.clip(min=0.)
+        if inplace:
+            x = self
         else:
-            xmax = bb[1][ix]
-            endx = self.test(dir=ix, min=xmax-xf)
-            func = lambda x: (1.-(xmax-x)/xf) ** exp
-        x = self.copy()
-        x[endx, iz] += f * func(x[endx, ix])
+            x = self.copy()
+        x[..., iz] += where(t > 0., f * t ** exp, 0.)
         return x
 
 
@@ -2025,8 +2038,8 @@ class Coords(ndarray):
         # make sure we use int32 (for the fast fuse function)
         # Using int32 limits this procedure to 10**9 points, which is more
         # than enough for all practical purposes
-        x = x.astype(float32)
-        val = val.astype(int32)
+        x = x.astype(float32, copy=False)
+        val = val.astype(int32, copy=False)
         tol = float32(max(abs(rtol*self.sizes()).max(), atol))
         nnod = val.shape[0]
         flag = ones((nnod,), dtype=int32)   # 1 = new, 0 = existing node
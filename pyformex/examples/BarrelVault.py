@@ -59,7 +59,9 @@ def run():
     # End bars
     e = Formex('l:2', 0).replic2(2, 2*n, 2*m, 1)
     # Create barrel
-    barrel = (d+h+e).rotate(90, 1).translate(0, r).scale([1., a/(2*n), l/(2*m)]).cylindrical()
+    # The rotation and translation are done in a single affine transform,
+    # the scaling is done by the cylindrical transform itself
+    barrel = (d+h+e).affine(rotationMatrix(90, 1), [r, 0., 0.]).cylindrical(scale=[1., a/(2*n), l/(2*m)])
 
     draw(barrel)
 
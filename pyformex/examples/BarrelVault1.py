@@ -55,7 +55,9 @@ def run():
     g = Formex('4:0123').replic2(m, n).toMesh().convert(eltype)
 
     # Create barrel
-    barrel = g.rotate(90, 1).translate(0, r).scale([1., a/n, l/m]).cylindrical()
+    # The rotation and translation are done in a single affine transform,
+    # the scaling is done by the cylindrical transform itself
+    barrel = g.affine(rotationMatrix(90, 1), [r, 0., 0.]).cylindrical(scale=[1., a/n, l/m])
 
     draw(barrel, color=red, bkcolor=blue)
 
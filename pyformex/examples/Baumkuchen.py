@@ -58,10 +58,11 @@ def run():
     p = array(a1.center())
     p[2] = e1
     f = lambda x:1-(x/18)**2/2
+    g = lambda x:1-(x/6)**2/2
     a2 = a1.bump(2, p, f, 1)
     draw(a2, view='bottom', color='red')
-    p[2] = e2
-    a3 = a2.bump(2, p, lambda x:1-(x/6)**2/2, 0)
+    # Apply both bumps to the original grid in a single pass
+    a3 = a1.map(lambda x, y, z: [x, y, z + e1*f(y-p[1]) + e2*g(x-p[0])])
     draw(a3, view='bottom', color='green')
     # Replicate the structure in x-direction
     a4 = a3.replicate(k, dir=0, step=m)
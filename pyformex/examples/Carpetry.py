@@ -43,6 +43,13 @@ def atExit():
     pf.GUI.setBusy(False)
 
 
+def randomFloats(n):
+    """Generate random floats in [0,1), drawn in batches of n"""
+    while True:
+        for r in random.rand(n):
+            yield r
+
+
 def drawMesh(M):
     clear()
     draw(M)
@@ -76,13 +83,21 @@ def run():
 
     save = False
 
+    # The possible conversions only depend on the element type,
+    # so we collect them only once for each element type
+    conversions_of = {}
+
     def carpet(M):
         conversions = []
-        nconv = random.randint(minconv, maxconv)
+        rnd = randomFloats(2*maxconv)
+        nconv = minconv + int(next(rnd) * (maxconv-minconv))
 
         while (len(conversions) < nconv and M.nelems() < maxelems) or M.nelems() < minelems:
-            possible_conversions = list(M.elType().conversions)
-            i = random.randint(len(possible_conversions))
+            eltype = M.elType()
+            if eltype not in conversions_of:
+                conversions_of[eltype] = list(eltype.conversions)
+            possible_conversions = conversions_of[eltype]
+            i = int(next(rnd) * len(possible_conversions))
             conv = possible_conversions[i]
             conversions.append(conv)
             M = M.convert(conv)
@@ -95,7 +110,7 @@ def run():
         print("conversions: %s" % conversions)
 
         # Coloring
-        key = possible_keys[random.randint(nkeys)]
+        key = possible_keys[int(next(rnd) * nkeys)]
         print("colored by %s" % key)
         func = V[key][0]
         S = TriSurface(M)
@@ -103,8 +118,8 @@ def run():
         export({'surface':S})
         surface_menu.selection.set(['surface'])
         surface_menu.showSurfaceValue(S, str(conversions), val, False)
-        for a in pf.canvas.scene.decorations+pf.canvas.scene.annotations:
-            undraw(a)
+        # undraw all at once, to update the canvas only once
+        undraw(pf.canvas.scene.decorations+pf.canvas.scene.annotations)
 
     clear()
     flatwire()
@@ -34,7 +34,6 @@ _techniques = ['connect', 'dialog', 'animation']
 
 from pyformex.gui.draw import *
 
-from pyformex import zip
 from pyformex.simple import circle
 from pyformex.geomtools import rotationAngle
 
@@ -78,8 +77,11 @@ def run():
     # diameters varying linearly with the |x| coordinate
     diam = 0.1*h*(2.-abs(C[:, 0]))
     # finally, here are the circles:
-    circles = [ circle().scale(d).rotate(a, r).translate(c) for d, r, a, c in zip(diam, rot, ang, C) ]
-    F = Formex.concatenate(circles).setProp(3)
+    # all circles are transformed at once from a single base circle
+    base = circle().coords
+    mat = rotationMatrices(ang, rot)
+    X = einsum('pqj,njk->npqk', base, mat) * diam[:, newaxis, newaxis, newaxis] + C[:, newaxis, newaxis]
+    F = Formex(X.reshape(-1, 2, 3)).setProp(3)
     draw(F)
 
     # And now something more fancy: connect 1 out of 15 points of the circles
@@ -94,14 +96,17 @@ def run():
 
         if res['Connect circles'] or res['Create Triangles']:
             conn = arange(0, 180, 15)
+            # first points of the selected segments of all circles
+            P = X[:, conn, 0]
 
         if res['Connect circles']:
-            G = Formex.concatenate([ connect([c1.select(conn), c2.select(conn)]) for c1, c2 in zip(circles[:-1], circles[1:]) ])
+            G = Formex(stack([P[:-1], P[1:]], axis=2).reshape(-1, 2, 3))
             draw(G)
 
         if res['Create Triangles']:
             conn1 = concatenate([conn[1:], conn[:1]])
-            G = Formex.concatenate([ connect([c1.select(conn), c2.select(conn), c2.select(conn1)]) for c1, c2 in zip(circles[:-1], circles[1:]) ])
+            P1 = X[:, conn1, 0]
+            G = Formex(stack([P[:-1], P[1:], P1[1:]], axis=2).reshape(-1, 3, 3))
             smooth()
             draw(G)
 
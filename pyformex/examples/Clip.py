@@ -35,6 +35,22 @@ _techniques = ['color']
 from pyformex.gui.draw import *
 from pyformex import zip
 from pyformex import simple
+from itertools import cycle, islice
+
+
+def addBumps(F, spots, func):
+    """Bump the z-coordinate of F at each of the spots.
+
+    This has the same result as applying F.bump(2,p,func,[0,1]) for
+    all the points p in spots, but the distances from all points of F
+    to all spots are computed at once by broadcasting. Spots with a
+    zero height are skipped.
+    """
+    spots = spots[spots[:, 2] != 0.]
+    X = F.coords.copy()
+    d = length(X[..., newaxis, :2] - spots[:, :2])
+    X[..., 2] += dot(func(d), spots[:, 2]) / func(0)
+    return Formex(X, F.prop, F.eltype)
 
 
 def run():
@@ -52,10 +68,10 @@ def run():
     h = 0.15*n
     r = n//m
     s = n//r
-    a = [ [r*i, r*j, h]  for j in range(1, s) for i in range(1, s) ]
+    j, i = indices((s-1, s-1)) + 1
+    a = column_stack([r*i.ravel(), r*j.ravel(), full((s-1)**2, h, dtype=float)])
 
-    for p in a:
-        F = F.bump(2, p, lambda x:exp(-0.75*x), [0, 1])
+    F = addBumps(F, a, lambda x:exp(-0.75*x))
 
 
     # Define a plane
@@ -63,15 +79,15 @@ def run():
     plane_n = [2.0, 1.0, 0.0]
     #compute number of nodes above/below the plane
     dist = F.distanceFromPlane(plane_p, plane_n)
-    above = (dist>0.0).sum(-1)
-    below = (dist<0.0).sum(-1)
+    above = count_nonzero(dist>0.0, axis=-1)
+    below = count_nonzero(dist<0.0, axis=-1)
 
     # Define a line by a point and direction
     line_p = [0.0, 0.0, 0.0]
     line_n = [1., 1., 1./3]
     d = F.distanceFromLine(line_p, line_n)
     # compute number of nodes closer that 2.2 to line
-    close = (d < 2.2).sum(-1)
+    close = count_nonzero(d < 2.2, axis=-1)
 
 
 
@@ -99,18 +115,17 @@ def run():
 
     draw(F)
 
-    color = getcfg('canvas/colormap')[1:] # omit the black
-    while len(color) < len(sel):
-        color.extend(color)
-    color[0:0] = ['black'] # restore the black
-    prop = zeros(F.nelems())
-    i = 1
-    for s, t in zip(sel, txt):
-        prop[s] = i
+    # repeat the colormap (without the black) for all selections
+    colormap = getcfg('canvas/colormap')[1:]
+    color = ['black'] + list(islice(cycle(colormap), len(sel)))
+    # since the later selections get higher numbers, the running maximum
+    # holds the prop numbers after each selection step
+    sel = row_stack(sel).astype(bool)
+    props = maximum.accumulate(sel * arange(1, len(sel)+1)[:, newaxis], axis=0)
+    for i, (s, t, prop) in enumerate(zip(sel, txt, props)):
         F.setProp(prop)
-        print('%s (%s): %s' % (color[i], sum(s), t))
+        print('%s (%s): %s' % (color[i+1], sum(s), t))
         draw(F)
-        i += 1
 
     print('Clip Formex to last selection')
     draw(F.clip(s), view=None)
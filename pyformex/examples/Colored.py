@@ -53,7 +53,9 @@ def run():
     i=0
     for shape in Shapes:
         F = Formex(shape).replic2(4, 2)
-        color3 = resize(color2, F.shape) # full color
+        # full color: a color for each vertex, the same for all elements
+        rgb = resize([ GLcolor(c) for c in color2 ], (F.nplex(), 3))
+        color3 = broadcast_to(rgb, F.shape)
         #print F.shape,color3
         #print [ GLcolor(c) for c in color3]
         #continue
@@ -41,42 +41,45 @@ from pyformex.elements import elementType,elementTypes
 from pyformex.mesh import Mesh
 from pyformex import utils
 from pyformex import olist
+from pyformex import zip
+from multiprocessing.pool import ThreadPool
 
 
 colors = [black, blue, yellow, red]
 
-def showElement(eltype, options):
-    print(eltype)
-    clear()
-    drawText("Element type: %s" %eltype, (100, 200), size=18, color=black)
-    el = elementType(eltype)
-    print(el)
+# Cache of element types and their Mesh, by element type name
+_base_meshes = {}
 
-    if options['Show report']:
-        print(el.report())
+def baseMesh(eltype):
+    """Return the element type and its Mesh for the element type name.
 
-    M = el.toMesh()
+    The results are cached, so the Mesh should not be changed in place.
+    """
+    if eltype not in _base_meshes:
+        el = elementType(eltype)
+        _base_meshes[eltype] = el, el.toMesh()
+    return _base_meshes[eltype]
 
-    ndim = el.ndim
 
-    if ndim == 3:
-        view('iso')
-        smooth()
-    else:
-        view('front')
-        if options['Force dimensionality']:
-            flatwire()
-        else:
-            smoothwire()
+def prepareElement(eltype, options):
+    """Create the geometry to show for the element type.
+
+    This does not touch the canvas, so it can run in a worker thread.
+    Returns the element type and the geometry.
+    """
+    el, M = baseMesh(eltype)
+    M = M.copy()
 
     #print options['Deformed']
     if options['Deformed']:
-        M.coords = M.coords.addNoise(rsize=0.1)
+        # Add noise in place, only to the axes that are not forced to zero
         if options['Force dimensionality']:
-            if ndim < 3:
-                M.coords[..., 2] = 0.0
-            if ndim < 2:
-                M.coords[..., 1] = 0.0
+            naxes = max(el.ndim, 1)
+        else:
+            naxes = 3
+        X = M.coords
+        noise = 0.1 * X.sizes().max()
+        X[..., :naxes] += randomNoise(X[..., :naxes].shape, -noise, noise)
 
     i = 'xyz'.find(options['Mirrored'])
     if i>=0:
@@ -90,8 +93,41 @@ def showElement(eltype, options):
     elif options['Draw as'] == 'Border':
         M = M.getBorderMesh()
 
+    return el, M
+
+
+def showElement(eltype, options, prepared=None):
+    """Show the element type.
+
+    If the geometry was already created by :func:`prepareElement`,
+    it can be passed as `prepared`.
+    """
+    print(eltype)
+    clear()
+    drawText("Element type: %s" %eltype, (100, 200), size=18, color=black)
+    if prepared is None:
+        prepared = prepareElement(eltype, options)
+    el, M = prepared
+    print(el)
+
+    if options['Show report']:
+        print(el.report())
+
+    ndim = el.ndim
+
+    if ndim == 3:
+        view('iso')
+        smooth()
+    else:
+        view('front')
+        if options['Force dimensionality']:
+            flatwire()
+        else:
+            smoothwire()
+
     draw(M.coords)#,color=None,wait=False)
-    drawNumbers(M.coords, color=None)
+    if options['Show numbers']:
+        drawNumbers(M.coords, color=None)
 
 
     if options['Color setting'] == 'prop':
@@ -113,6 +149,7 @@ def run():
         'Color setting': 'direct',
         'Force dimensionality': False,
         'Show report': False,
+        'Show numbers': True,
         }
     res.update(pf.PF.get('Elements_data', {}))
     #print res
@@ -127,6 +164,7 @@ def run():
             _I('Color setting', itemtype='radio', choices=['direct', 'prop']),
             _I('Force dimensionality', itemtype='bool'),
             _I('Show report', itemtype='bool'),
+            _I('Show numbers', itemtype='bool'),
             ])
     if not res:
         return
@@ -141,8 +179,15 @@ def run():
         ellist = [eltype]
     clear()
     #delay(1)
-    for el in ellist:
-        showElement(el, res)
+    # Prepare the next element in a worker thread while the current
+    # one is drawn. All drawing stays in the main thread.
+    pool = ThreadPool(1)
+    try:
+        prepared = pool.imap(lambda el: prepareElement(el, res), ellist)
+        for el, p in zip(ellist, prepared):
+            showElement(el, res, p)
+    finally:
+        pool.close()
 
 
 if __name__ == '__draw__':
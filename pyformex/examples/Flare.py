@@ -34,15 +34,32 @@ _techniques = ['color', 'dialog', 'transform', 'function']
 
 from pyformex.gui.draw import *
 
+def grid(F, m, n):
+    """Replicate F on a grid of m by n unit steps in x and y direction.
+
+    This gives the same result as F.replic2(m,n,1,1), but creates all
+    the coordinates at once by broadcasting the grid steps.
+    """
+    iy, ix = indices((n, m))
+    steps = column_stack([ix.ravel(), iy.ravel(), zeros(m*n)])
+    X = F.coords + steps[:, newaxis, newaxis,:]
+    if F.prop is None:
+        prop = None
+    else:
+        prop = tile(F.prop, m*n)
+    return Formex(X.reshape(-1, F.nplex(), 3), prop, F.eltype)
+
+
 def addFlares(F,dir=[0, 2]):
     """Adds flares at both ends of the structure.
 
     The flare parameters are hardcoded, a real-life example would
     make them adjustable.
+    The coordinates of F are changed inplace.
     Returns the flared structure.
     """
-    F = F.flare(m/4., -1., dir, 0, 0.5)
-    F = F.flare(m/4., 1.5, dir, 1, 2.)
+    F.coords.flare(m/4., -1., dir, 0, 0.5, inplace=True)
+    F.coords.flare(m/4., 1.5, dir, 1, 2., inplace=True)
     return F
 
 def run():
@@ -68,7 +85,7 @@ def run():
     globals().update(res)
 
     # Construct the geometry
-    F = Formex('3:.12.34', [0, 1]).replic2(m, n, 1, 1)
+    F = grid(Formex('3:.12.34', [0, 1]), m, n)
     if f0:
         F = addFlares(F)
 
@@ -45,14 +45,13 @@ def drawAxis(len, dir, text):
     drawText(text, F[0][1]+(2., -0.5, 0.), size=18)
     return F
 
-def drawFrame(P):
-    """Draw a dashed frame at position P."""
+def createFrame(P):
+    """Create a dashed frame at position P."""
     d, e = (2, 3) # dash length and step
     h = Formex('l:1').scale(d)
     v = h.rotate(-90).replic(4, -e, 1)
     h = h.replic(6, e, 0)
-    frame = (h + v).trl(P)
-    draw(frame, linewidth=1.0, bbox=None)
+    return (h + v).trl(P)
 
 def run():
     clear()
@@ -62,8 +61,9 @@ def run():
     drawAxis(30, -90, 'axis 1: points: length = self.nplex()')
     F = drawAxis(50, 30, 'axis 0: elements: length = self.nelems()').divide(8)
 
-    for i in range(1, 5, 2):
-        drawFrame(F[i][1])
+    # draw all frames at once
+    frames = Formex.concatenate([ createFrame(F[i][1]) for i in range(1, 5, 2) ])
+    draw(frames, linewidth=1.0, bbox=None)
 
     zoomAll()
 
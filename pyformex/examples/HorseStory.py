@@ -36,6 +36,9 @@ _techniques = ['animation', 'colors']
 
 from pyformex.gui.draw import *
 
+# A private random generator, seeded once, to get reproducible colors
+_rng = random.RandomState(0)
+
 
 def run():
     global y
@@ -88,11 +91,15 @@ def run():
     pause()
 
     say('A method as yet unknown!')
-    colors = 0.1 * random.random((10, 3))
-    for color in colors:
-        B = draw(T, color=color)
-        undraw(A)
-        A = B
+    colors = 0.1 * _rng.random_sample((10, 3))
+    # draw the clone once, then only change its object color
+    B = draw(T, color=colors[0])
+    undraw(A)
+    A = B
+    sleep(0.5)
+    for color in colors[1:]:
+        A.objectColor = color
+        pf.canvas.update()
         sleep(0.5)
 
 if __name__ == '__draw__':
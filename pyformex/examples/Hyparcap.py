@@ -35,6 +35,7 @@ _topics = ['geometry']
 _techniques = ['color']
 
 from pyformex.gui.draw import *
+import math
 
 def run():
     clear()
@@ -47,7 +48,10 @@ def run():
     k1 = 0.035 # steilte
     hoek = (90.-b)/2
     d = 2. # laagdikte
-    c = (x*s+k1*s*s/2*sin(radians(2*hoek)))/(k1*s*cos(radians(hoek))+k1*s*sin(radians(hoek))) # pentacapvoorwaarde
+    # goniometrische constanten (scalairen: math is sneller dan numpy)
+    sh, ch, s2h = math.sin(math.radians(hoek)), math.cos(math.radians(hoek)), math.sin(math.radians(2*hoek))
+    sb, cb = math.sin(math.radians(b/2)), math.cos(math.radians(b/2))
+    c = (x*s+k1*s*s/2*s2h)/(k1*s*ch+k1*s*sh) # pentacapvoorwaarde
 
     # compret van 1 blad
     T = Formex([[[-a, 0, d], [-a+2, 0, d]], [[-a, 0, d], [1-a, 3, d]], [[1-a, 3, d], [2-a, 0, d]]], 1)
@@ -55,17 +59,21 @@ def run():
     W1 = Formex([[[2-a, 2, 0], [1-a, 3, d]], [[2-a, 2, 0], [3-a, 3, d]], [[2-a, 2, 0], [2-a, 0, d]]])
     W2 = Formex([[[1-a, -1, 0], [-a, 0, d]], [[1-a, -1, 0], [2-a, 0, d]], [[1-a, -1, 0], [1-a, -3, d]]])
     W3 = Formex([[[0, 3*a, d], [0, 3*(a-1)-1, 0]]])
-    top = T.replic2(a, a, 2, 3, bias=1, taper=-1).reflect(1, 0, True).removeDuplicate()
-    bot = B.replic2(a-1, a-1, 2, 3, bias=1, taper=-1).reflect(1, -1, True).removeDuplicate()
+    # de replic2 patronen bevatten geen dubbele staven: removeDuplicate overbodig
+    top = T.replic2(a, a, 2, 3, bias=1, taper=-1).reflect(1, 0, True)
+    bot = B.replic2(a-1, a-1, 2, 3, bias=1, taper=-1).reflect(1, -1, True)
     web = W1.replic2(a-1, a-1, 2, 3, bias=1, taper=-1) + W2.replic2(a, a, 2, -3, bias=1, taper=-1) + W3
     blad = (top+bot+web).scale([1., 1./3, 1.]).translate([0, a, 0])
-    # herschalen
-    vlakblad = blad.scale([s*sin(radians(b/2))/a, s*cos(radians(b/2))/a, 1.]).rotate(-45.)
-    # transleren en mappen op hyperbolische paraboloide (z=k1*x*y)
-    vlakblad2=vlakblad.translate([-c, -c, 0])
-    j=vlakblad2.map(lambda x, y, z:[x, y, k1*x*y])
-    #overige bladen genereren
-    hyparcap=j.translate([c, c, 0]).rosette(m, 360./m, 2, [0., 0., 0.])
+    # herschalen, roteren en transleren in een enkele affiene transformatie
+    mat = dot(diag([s*sb/a, s*cb/a, 1.]), rotationMatrix(-45., 2)).astype(Float)
+    X = blad.coords.affine(mat, [-c, -c, 0.])
+    # mappen op hyperbolische paraboloide (z=k1*x*y)
+    X[..., 2] = k1 * X[..., 0] * X[..., 1]
+    # terug transleren en overige bladen genereren: de m rotaties worden
+    # samen uitgevoerd, met de terugtranslatie mee geroteerd
+    R = rotationMatrices(arange(m)*b, [0., 0., 1.]).astype(Float)
+    Y = einsum('eij,mjk->meik', X, R) + dot(array([c, c, 0.], dtype=Float), R)[:, newaxis, newaxis]
+    hyparcap = Formex(Y.reshape(-1, 2, 3), blad.prop, blad.eltype)
     draw(hyparcap)
 
 
@@ -37,6 +37,22 @@ _techniques = ['color']
 
 from pyformex.gui.draw import *
 
+def grid(F, nx, ny, dx, dy):
+    """Replicate F on a grid of nx by ny steps dx and dy in x and y direction.
+
+    This gives the same result as F.replic2(nx,ny,dx,dy), but creates
+    all the coordinates at once by broadcasting the grid steps.
+    """
+    iy, ix = indices((ny, nx))
+    steps = column_stack([dx*ix.ravel(), dy*iy.ravel(), zeros(nx*ny)]).astype(Float)
+    X = F.coords + steps[:, newaxis, newaxis,:]
+    if F.prop is None:
+        prop = None
+    else:
+        prop = tile(F.prop, nx*ny)
+    return Formex(X.reshape(-1, F.nplex(), 3), prop, F.eltype)
+
+
 def run():
     clear()
     nx=12   # number of modules in circumferential direction
@@ -47,12 +63,13 @@ def run():
     rings=False # set to True to include horizontal rings
     e1 = Formex([[[0, 0], [1, 1]]], 1).rosette(4, 90).translate([1, 1, 0]) # diagonals
     e2 = Formex([[[0, 0], [2, 0]]], 0) # border
-    f1 = e1.replic2(nx, ny, 2, 2)
+    f1 = grid(e1, nx, ny, 2, 2)
     if rings:
-        f2 = e2.replic2(nx, ny+1, 2, 2)
+        f2 = grid(e2, nx, ny+1, 2, 2)
     else:
-        f2 = e2.replic2(nx, 2, 2, 2*ny)
-    g = (f1+f2).translate([0, a, 1]).spherical(scale=[180./nx, t/(2*ny+a), rd], colat=True)
+        f2 = grid(e2, nx, 2, 2, 2*ny)
+    # only transform the unique nodes: they are shared by several elements
+    g = (f1+f2).translate([0, a, 1]).toMesh().spherical(scale=[180./nx, t/(2*ny+a), rd], colat=True).toFormex()
     draw(e1+e2)
 
     draw(f1+f2)
@@ -39,6 +39,33 @@ from pyformex.geomtools import *
 from pyformex.simple import circle
 
 
+def candidatePairs(F1, F2):
+    """Find the pairs of segments of F1 and F2 with overlapping bboxes.
+
+    The segments of F2 are sorted on their minimal x-value, and for
+    each segment of F1 only the range of segments of F2 that can
+    overlap in x-direction is considered.
+
+    Returns two int arrays with the indices of the candidate segments
+    in F1 and F2, sorted on the first, then the second index.
+    """
+    lo1, hi1 = F1.coords.min(axis=1), F1.coords.max(axis=1)
+    lo2, hi2 = F2.coords.min(axis=1), F2.coords.max(axis=1)
+    order = lo2[:, 0].argsort()
+    x2 = lo2[order, 0]
+    # A segment of F2 starting before this value can not reach F1
+    first = x2.searchsorted(lo1[:, 0] - (hi2[:, 0]-lo2[:, 0]).max())
+    last = x2.searchsorted(hi1[:, 0], side='right')
+    count = (last-first).clip(min=0)
+    i = arange(F1.nelems()).repeat(count)
+    start = (first - count.cumsum() + count).repeat(count)
+    j = order[arange(count.sum()) + start]
+    ok = ((lo1[i] <= hi2[j]) & (lo2[j] <= hi1[i])).all(axis=-1)
+    i, j = i[ok], j[ok]
+    k = lexsort((j, i))
+    return i[k], j[k]
+
+
 def intersection(F1, F2):
     """Return the intersection of two Formices.
 
@@ -55,26 +82,28 @@ def intersection(F1, F2):
 
     from pyformex import geomtools as gt
 
-    errh = seterr(divide='ignore', invalid='ignore') # ignore division errors
-    q1 = F1[:, 0]
-    m1 = F1[:, 1]-F1[:, 0]
-    q2 = F2[:, 0]
-    m2 = F2[:, 1]-F2[:, 0]
+    # Only segments with overlapping bboxes can intersect
+    w1, w2 = candidatePairs(F1, F2)
+    q1 = F1[w1, 0]
+    m1 = F1[w1, 1]-F1[w1, 0]
+    q2 = F2[w2, 0]
+    m2 = F2[w2, 1]-F2[w2, 0]
 
-    # Compute all intersection points of the lines
-    t1, t2 = gt.intersectLineWithLine(q1, m1, q2, m2, mode='all', times=True)
-    X1 = pointsAtLines(q1[:, newaxis], m1[:, newaxis], t1)
-    X2 = pointsAtLines(q2, m2, t2)
-    seterr(**errh) # reactivate division errors
+    # Compute the parameter values of the intersection points of the lines
+    with errstate(divide='ignore', invalid='ignore'): # ignore division errors
+        t1, t2 = gt.intersectLineWithLine(q1, m1, q2, m2, mode='pair', times=True)
 
     # Keep intersecting segments
-    inside = (t1>=0.0)*(t1<=1.0)*(t2>=0.0)*(t2<=1.0)
-    w1, w2 = where(inside)
+    inside = (t1>=0.0) & (t1<=1.0) & (t2>=0.0) & (t2<=1.0)
+    w1, w2 = w1[inside], w2[inside]
+
+    # Only compute the points for the intersecting segments
+    X1 = pointsAtLines(q1[inside], m1[inside], t1[inside])
+    X2 = pointsAtLines(q2[inside], m2[inside], t2[inside])
 
-    # Find coinciding intersection points and the intersecting segments
-    X1, X2 = X1[inside], X2[inside]
-    matches = X2.match(X1)
-    ok = matches!=-1
+    # Keep the pairs where the points on both lines coincide.
+    # X1 and X2 are paired, so no search for matching points is needed.
+    ok = isClose(X1, X2, atol=1.e-5).all(axis=-1)
 
     return X1[ok], w1[ok], w2[ok]
 
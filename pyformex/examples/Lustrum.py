@@ -48,18 +48,25 @@ _techniques = ['color', 'persistence', 'lima', 'import']
 from pyformex.gui.draw import *
 from pyformex.examples.Lima import *
 
+# Cache of the data read from the geometry file
+_blippo = {}
+
 def run():
     resetAll()
     flat()
     linewidth(2)
     fgcolor(blue)
     grow('Plant1', ngen=7, clearing=False, text=False)
-    data = readGeomFile(os.path.join(pf.cfg['datadir'], 'blippo.pgf'))
-    curve = data['blippo-0']
+    if not _blippo:
+        _blippo.update(readGeomFile(os.path.join(pf.cfg['datadir'], 'blippo.pgf')))
+    curve = _blippo['blippo-0'].copy()
     bb = curve.coords.bbox()
     ctr = bb.center()
     siz = bb.sizes()
-    curve.coords = curve.coords.trl(0, -ctr[0]).scale(50./siz[0])
+    # the curve is a copy, so we can transform it inplace
+    X = curve.coords
+    X[:, 0] -= ctr[0]
+    X *= 50./siz[0]
     draw(curve, color=pyformex_pink, linewidth=5)
 
 if __name__ == '__draw__':
@@ -35,13 +35,28 @@ _topics = ['surface']
 _techniques = ['cut']
 
 from pyformex.gui.draw import *
+from pyformex.simple import sphere
+
+# Cache of the scaled spheres, by (ndiv,scale)
+_spheres = {}
+
+def scaledSphere(ndiv, scale):
+    """Return a copy of a sphere(ndiv) scaled with scale.
+
+    The sphere is only constructed on the first call with these
+    parameters.
+    """
+    key = (ndiv, scale)
+    if key not in _spheres:
+        _spheres[key] = sphere(ndiv).scale(scale)
+    return _spheres[key].copy()
+
 
 def run():
     clear()
     smooth()
 
-    from pyformex.simple import sphere
-    S = sphere(8).scale(3.)
+    S = scaledSphere(8, 3.)
     T = S.cutWithPlane([[2., 0., 0.], [0., 1., 0.], [-2., 0., 0.], [0., -1., 0.]],
                        [[-1., 0., 0.], [0., -1., 0.], [1., 0., 0.], [0., +1., 0.]],
                        side = '-')
@@ -35,13 +35,24 @@ _techniques = ['palette', 'align']
 
 from pyformex.gui.draw import *
 
+def quadGrid(nx, ny):
+    """Create a grid of nx by ny unit squares.
+
+    This gives the same result as Formex('4:0123').replic2(nx,ny), but
+    creates all the coordinates at once by broadcasting the grid steps.
+    """
+    iy, ix = indices((ny, nx))
+    steps = column_stack([ix.ravel(), iy.ravel(), zeros(nx*ny)]).astype(Float)
+    return Formex(Formex('4:0123').coords + steps[:, newaxis])
+
+
 def run():
     clear()
     flat()
     palette = pf.canvas.settings.colormap
     ncolors = len(palette)
-    F = Formex('4:0123').replic2(ncolors//2, 2).setProp(arange(ncolors))
-    G = Formex('4:0123').replic2(ncolors+1, ncolors-1).setProp(arange(ncolors))
+    F = quadGrid(ncolors//2, 2).setProp(arange(ncolors))
+    G = quadGrid(ncolors+1, ncolors-1).setProp(arange(ncolors))
     draw(align([F, G], '|00', offset=[1., 0., 0.]))
 
 
@@ -34,6 +34,7 @@ _topics = ['geometry']
 _techniques = ['color', 'pattern']
 
 from pyformex.gui.draw import *
+from pyformex import zip
 from pyformex import simple
 from pyformex.opengl.decors import Grid
 
@@ -44,13 +45,18 @@ def run():
     grid = Grid(nx=(4, 4, 0), ox=(-2.0, -2.0, 0.0), dx=(1.0, 1.0, 1.0), planes='n', linewidth=1)
     draw(grid)
     linewidth(3)
-    FA = None
     setDrawOptions({'bbox':None})
-    for n, p in simple.Pattern.items():
+    # Create all the actors at once, initially hidden,
+    # and then only switch the visibility
+    patterns = list(simple.Pattern.items())
+    actors = draw([Formex(p) for n, p in patterns], bbox=None, color='red', visible=False)
+    FA = None
+    for (n, p), FB in zip(patterns, actors):
         print("%s = %s" % (n, p))
-        FB = draw(Formex(p), bbox=None, color='red')
+        FB.visible = True
         if FA:
-            undraw(FA)
+            FA.visible = False
+        pf.canvas.update()
         FA = FB
         pause()
 
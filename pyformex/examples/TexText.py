@@ -37,6 +37,7 @@ import pyformex as pf
 from pyformex.gui.draw import *
 
 from pyformex.opengl.textext import *
+from pyformex.opengl.texture import Texture
 
 def run():
     #
@@ -48,21 +49,25 @@ def run():
     fonts = utils.listMonoFonts()
     ft = FontTexture.default()
 
+    # the unit square, used for all the geometry below
+    Q = Formex('4:0123')
+    M = Q.toMesh()
+
     # - draw a square
     # - use the full character set in the default font as a texture
     # - the font textures are currently upside down, therefore we need
     #   to specify texcoords to flip the image
-    F = Formex('4:0123').scale(200).toMesh()
+    F = M.scale(200)
     A = draw(F,color=yellow,texture=ft,texcoords=array([[0,1],[1,1],[1,0],[0,0]]),texmode=2)
 
 
     # - draw 20 squares
     # - fill with specific text
     # - put this object on top
-    G = Formex('4:0123').replic2(10,2).scale(20).rot(30).trl([150,50,0])
+    G = Q.replic2(10,2).scale(20).rot(30).trl([150,50,0])
     text = [ ' pyFormex ','  rules!  ' ]
     text = text[1] + text[0]
-    tc = FontTexture.default().texCoords(text)
+    tc = ft.texCoords(text)
     draw(G,color=pyformex_pink,texture=ft,texcoords=tc,texmode=2,ontop=True)
 
 
@@ -87,12 +92,13 @@ def run():
     #drawViewportAxes3D((0.,0.,0.),color=blue)
 
     # draw a cross at the upper corners using an image file
+    # the image is loaded once into a Texture that is used by both crosses
     image = os.path.join(pf.cfg['pyformexdir'], 'data', 'mark_cross.png')
-    from pyformex.plugins.imagearray import qimage2numpy
-    image = qimage2numpy(image, indexed=False)
-    X = Formex('4:0123').scale(40).toMesh().align('000')
+    image = Texture(image)
+    X = M.scale(40).align('000')
     # at the right corner using direct texture drawing techniques
-    draw(X,texture=image,texcoords=array([[0,1],[1,1],[1,0],[0,0]]),texmode=0,rendertype=-1,opak=False,ontop=True,offset3d=[(200.,200.,0.),(200.,200.,0.),(200.,200.,0.),(200.,200.,0.),])
+    # (a single insertion point is passed to the shader as a uniform)
+    draw(X,texture=image,texcoords=array([[0,1],[1,1],[1,0],[0,0]]),texmode=0,rendertype=1,opak=False,ontop=True,offset3d=(200.,200.,0.))
     # at the left corner, using a Mark
     drawActor(Mark((0,200,0),image,size=40,color=red))
 
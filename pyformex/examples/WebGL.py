@@ -58,6 +58,9 @@ def createGeometry():
     """
     # A sphere
     S = sphere().scale(1.2)
+    # The normals of a sphere centered at the origin are exactly known:
+    # set them, so that they need not be computed by averaging
+    S.setNormals(normalize(S.coords[S.elems]))
     # A Cone
     T = sector(1.0, 360., 6, 36, h=1.0, diag='u').toSurface().scale(1.5).reverse()
     # A Cylinder
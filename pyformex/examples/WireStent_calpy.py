@@ -101,8 +101,9 @@ def analysis(stent):
     print("Compressed number of nodes: %s" % nnod)
 
     # Create an extra node on the axis for beam orientations
-    extra_node = array([[0.0, 0.0, -10.0]])
-    coords = concatenate([nodes, extra_node])
+    coords = empty((nnod+1, 3))
+    coords[:-1] = nodes
+    coords[-1] = [0.0, 0.0, -10.0]
     nnod = coords.shape[0]
     print("After adding a node for orientation: %s" % nnod)
 
@@ -110,20 +111,19 @@ def analysis(stent):
     # while incrementing node numbers with 1 (for calpy)
     # (remember props are 1,2,3, so are OK)
 
-    thirdnode = nnod*ones(shape=(nel, 1), dtype=int)
-    matnr = reshape(stent.prop, (nel, 1))
-    elements = concatenate([elems+1, thirdnode, matnr], 1)
+    elements = empty((nel, elems.shape[1]+2), dtype=int)
+    elements[:, :-2] = elems + 1
+    elements[:, -2] = nnod
+    elements[:, -1] = stent.prop
 
     # Create endnode sets (with calpy numbering)
     bb = stent.bbox()
     zlo = bb[0][2]
     zhi = bb[1][2]
     zmi = (zhi+zlo)/2.
-    count = zeros(nnod)
-    for n in elems.flat:
-        count[n] += 1
-    unconnected = arange(nnod)[count==1]
-    zvals = nodes[unconnected][:, 2]
+    count = bincount(elems.ravel(), minlength=nnod)
+    unconnected = where(count==1)[0]
+    zvals = nodes[unconnected, 2]
     #print zlo,zhi,zmi,zvals
     end0 = unconnected[zvals<zmi]
     end1 = unconnected[zvals>zmi]
@@ -148,11 +148,10 @@ def analysis(stent):
     elements = concatenate([elements, extra_elems])
 
     # Boundary conditions
-    s = ""
-    for n in end0_ext + 1:   # NOTICE THE +1 !
-        s += "  %d  1  1  1  1  1  1\n" % n
-    # Also clamp the fake extra node
-    s += "  %d  1  1  1  1  1  1\n" % nnod0
+    # Clamp the end connector nodes (NOTICE THE +1 !)
+    # and also clamp the fake extra node
+    bnodes = append(end0_ext + 1, nnod0)
+    s = ''.join(["  %d  1  1  1  1  1  1\n" % n for n in bnodes])
     print("Specified boundary conditions")
     print(s)
     bcon = ReadBoundary(nnod, 6, s)
@@ -178,8 +177,11 @@ def analysis(stent):
     ndof = bcon.max()
     loads = zeros((ndof, nlc), float)
     zforce = [ 0.0, 0.0, 1.0, 0.0, 0.0, 0.0 ]
-    for n in end1: # NO +1 HERE!
-        loads[:, 0] = AssembleVector(loads[:, 0], zforce, bcon[n,:])
+    # Scatter the zforce to the equations of all end1 nodes at once
+    dofs = bcon[end1].ravel() # NO +1 HERE!
+    vals = resize(zforce, dofs.shape)
+    ok = dofs > 0
+    add.at(loads[:, 0], dofs[ok]-1, vals[ok])
 
     # Perform analysis
     import calpy
@@ -221,7 +223,7 @@ def postproc(coords, elements, displ, frc):
     val = frc[:, 0, 0]
     # create a colorscale
     CS = ColorScale([blue, yellow, red], val.min(), val.max(), 0., 2., 2.)
-    cval = array([CS.color(v) for v in val])
+    cval = CS.colors(val)
     #aprint(cval,header=['Red','Green','Blue'])
     clear()
     draw(results, color=cval)
@@ -36,6 +36,48 @@ from pyformex.geometry import Geometry
 import re
 
 
+# Regular expression splitting the string data of a Formex into
+# the base and the pattern
+_string_data = re.compile("(((?P<base>[^:]*):)?(?P<data>.*))")
+
+# Cache for the coordinates created from string data
+_string_cache = {}
+
+def _string_coords(s):
+    """_Return the coordinate array for the string data of a Formex_
+
+    The results are cached, because the same strings are often used
+    over and over again. The returned array is read-only: make a copy
+    before using it as Formex coordinates.
+    """
+    try:
+        return _string_cache[s]
+    except KeyError:
+        pass
+
+    d = _string_data.match(s).groupdict()
+    base, data = d['base'], d['data']
+    if base is None or base == 'l':
+        data = array([(0, 0, 0)] + pattern(data, aslist=True), dtype=Float)
+        data = stack([data[:-1],data[1:]],axis=1)
+    ## removed in 0.9.1
+    ## elif base == 'm':
+    ##     data = mpattern(data)
+    else:
+        try:
+            nplex = int(base)
+            data = xpattern(data, nplex)
+        except:
+            raise ValueError("Invalid string data for Formex")
+
+    data = asarray(data, dtype=Float)
+    data.flags.writeable = False
+    if len(_string_cache) >= 256:
+        _string_cache.clear()
+    _string_cache[s] = data
+    return data
+
+
 ###########################################################################
 ##
 ##   Formex class
@@ -101,6 +143,10 @@ class Formex(Geometry):
     Because the coordinates are stored in an array with 3 axes,
     all the elements in a Formex must contain the same number of points.
     This number is called the plexitude of the Formex.
+    If the data are given as a float32 array that owns its data (i.e. is
+    not a view into another array), the Formex will use it without making
+    a copy, just like a Formex initialized by another Formex shares its
+    coordinates. Views are always copied.
 
     A Formex may be initialized with a string instead of the numerical
     coordinate data. The string has the format `#:data` where `#` is a
@@ -216,22 +262,13 @@ class Formex(Geometry):
             data = data.coords
         else:
             if isinstance(data, str):
-                d = re.compile("(((?P<base>[^:]*):)?(?P<data>.*))").match(data).groupdict()
-                base, data = d['base'], d['data']
-                if base is None or base == 'l':
-                    data = Coords.concatenate([origin(), pattern(data)])
-                    data = stack([data[:-1],data[1:]],axis=1)
-                ## removed in 0.9.1
-                ## elif base == 'm':
-                ##     data = mpattern(data)
-                else:
-                    try:
-                        nplex = int(base)
-                        data = xpattern(data, nplex)
-                    except:
-                        raise ValueError("Invalid string data for Formex")
+                # the cached array is shared: use a copy
+                data = _string_coords(data).copy()
 
-            data = asarray(data).astype(Float)
+            data = asarray(data, dtype=Float)
+            if data.base is not None:
+                # a view into another array: do not share its data
+                data = data.copy()
 
             if data.size == 0:   ### MAYBE THIS SHOULD BE CHANGED ?????
                 if len(data.shape) == 3:
@@ -255,11 +292,15 @@ class Formex(Geometry):
                 # this will be done by Coords
                 pass
                 if data.shape[-1] == 2:
-                    z = zeros((data.shape[0], data.shape[1], 1), dtype=Float)
-                    data = concatenate([data, z], axis=-1)
+                    data3 = zeros(data.shape[:2]+(3,), dtype=Float)
+                    data3[:, :, :2] = data
+                    data = data3
 
         # data should be OK now
-        self.coords = Coords(data)    # make sure coordinates are a Coords object
+        if isinstance(data, Coords) and data.dtype == Float:
+            self.coords = data
+        else:
+            self.coords = Coords(data)    # make sure coordinates are a Coords object
         self.setProp(prop)
 
         try:
@@ -274,9 +315,12 @@ class Formex(Geometry):
         """Replace the current coords with new ones.
 
         """
-        coords = Coords(coords)
+        if not (isinstance(coords, Coords) and coords.dtype == Float):
+            coords = Coords(coords)
         if coords.shape == self.coords.shape:
-            F = Formex(coords, self.prop, self.eltype)
+            # Use the new coords as they are: Formex(coords) would copy them
+            F = Formex(self)
+            F.coords = coords
             F.attrib(**self.attrib)
             return F
         else:
@@ -312,6 +356,17 @@ class Formex(Geometry):
             del state['f']
         self.__dict__.update(state)
 
+
+    def __getstate__(self):
+        """Return the state for serialization.
+
+        The spare buffer space used by :meth:`append` is not saved.
+        """
+        state = self.__dict__.copy()
+        state.pop('_appendbuf', None)
+        return state
+
+
     def element(self, i):
         """Return element i of the Formex"""
         return self.coords[i]
@@ -364,7 +419,8 @@ class Formex(Geometry):
         This is the product of the number of elements in the formex
         with the number of nodes per element.
         """
-        return self.coords.shape[0]*self.coords.shape[1]
+        nelems, nplex = self.coords.shape[:2]
+        return nelems*nplex
 
 
     ncoords = npoints
@@ -470,7 +526,10 @@ class Formex(Geometry):
         are the mean values of all points of the element.
         The return value is a Coords object with nelems points.
         """
-        return self.coords.mean(axis=1)
+        # einsum sums over the points much faster than mean does
+        c = einsum('ijk->ik', self.coords)
+        c /= self.coords.shape[1]
+        return Coords(c)
 
 
     # Data conversion
@@ -495,8 +554,7 @@ class Formex(Geometry):
         """
         if atol is None:
             atol = rtol * self.dsize()
-        coords = reshape(self.coords, (self.nnodes(), 3))
-        coords, index = coords.fuse(ppb, 0.5, rtol=rtol, atol=atol, repeat=repeat)
+        coords, index = self.coords.points().fuse(ppb, 0.5, rtol=rtol, atol=atol, repeat=repeat)
         index = index.reshape(self.coords.shape[:2])
         return coords, index
 
@@ -549,24 +607,12 @@ maxprop  = %s
     @classmethod
     def point2str(clas, point):
         """Return a string representation of a point"""
-        s = ""
-        if len(point)>0:
-            s += str(point[0])
-            if len(point) > 1:
-                for i in point[1:]:
-                    s += "," + str(i)
-        return s
+        return ",".join([ str(i) for i in point ])
 
     @classmethod
     def element2str(clas, elem):
         """Return a string representation of an element"""
-        s = "["
-        if len(elem) > 0:
-            s += clas.point2str(elem[0])
-            if len(elem) > 1:
-                for i in elem[1:]:
-                    s += "; " + clas.point2str(i)
-        return s+"]"
+        return "[" + "; ".join([ clas.point2str(i) for i in elem ]) + "]"
 
     def asFormex(self):
         """Return string representation of a Formex as in Formian.
@@ -579,13 +625,11 @@ maxprop  = %s
            >>> print(F)
            {[1.0,0.0,0.0; 0.0,1.0,0.0], [0.0,1.0,0.0; 1.0,2.0,0.0]}
         """
-        s = "{"
-        if len(self.coords) > 0:
-            s += self.element2str(self.coords[0])
-            if len(self.coords) > 1:
-                for i in self.coords[1:]:
-                    s += ", " + self.element2str(i)
-        return s+"}"
+        # Format all elements with the same format string: this is the
+        # same as element2str, but a lot faster
+        nelems, nplex, ndim = self.coords.shape
+        fmt = "[" + "; ".join([",".join(["%s"]*ndim)]*nplex) + "]"
+        return "{" + ", ".join([ fmt % tuple(e) for e in self.coords.reshape(nelems, nplex*ndim) ]) + "}"
 
     def asFormexWithProp(self):
         """Return string representation as Formex with properties.
@@ -649,18 +693,23 @@ maxprop  = %s
             self.prop = F.prop
             return self
 
-        self.coords = Coords(concatenate((self.coords, F.coords)))
+        # Repeated appends grow the data in spare buffer space
+        cbuf, pbuf = getattr(self, '_appendbuf', (None, None))
+        n = self.coords.shape[0]
+        # This raises an error if the plexitudes differ: do it first
+        self.coords, cbuf = _extend(self.coords, F.coords, cbuf)
         ## What to do if one of the formices has properties, the other one not?
         ## The current policy is to use zero property values for the Formex
         ## without props
         if self.prop is not None or F.prop is not None:
             if self.prop is None:
-                self.prop = zeros(shape=self.coords.shape[:1], dtype=Int)
+                self.prop = zeros(shape=(n,), dtype=Int)
             if F.prop is None:
                 p = zeros(shape=F.coords.shape[:1], dtype=Int)
             else:
                 p = F.prop
-            self.prop = concatenate((self.prop, p))
+            self.prop, pbuf = _extend(self.prop, p, pbuf)
+        self._appendbuf = (cbuf, pbuf)
         return self
 
 
@@ -687,10 +736,20 @@ maxprop  = %s
         This returns a Formex with all elements of self and other.
         It allows us to write simple expressions as F+G to concatenate
         the Formices F and G.
+        The result keeps the eltype and attributes of self.
         """
-        return self.copy().append(other)
-    # BV: would Formex.concatenate([self,other]) be better?
-    #
+        if other.coords.size == 0:
+            return self.copy()
+        if self.coords.size == 0:
+            # keep eltype and attributes of self, but the data of other
+            F = self.copy()
+            F.coords = other.coords.copy()
+            F.prop = None if other.prop is None else other.prop.copy()
+            return F
+        # concatenate avoids copying self before appending other
+        F = Formex.concatenate([self, other])
+        F.attrib(**self.attrib)
+        return F
 
     @classmethod
     def concatenate(clas, Flist):
@@ -717,22 +776,25 @@ maxprop  = %s
         We made it a class method and not a global function, because that
         would interfere with NumPy's own concatenate function.
         """
-        def _force_prop(m):
-            if m.prop is None:
-                return zeros(m.nelems(), dtype=Int)
-            else:
-                return m.prop
-
-        f = concatenate([ F.coords for F in Flist ])
-
-        # Keep the available props
-        prop = [F.prop for F in Flist if F.prop is not None]
-        if len(prop) == 0:
-            prop = None
-        elif len(prop) < len(Flist):
-            prop = concatenate([_force_prop(F) for F in Flist])
+        if len(Flist) == 0:
+            raise ValueError("Need at least one Formex to concatenate")
+        nplex = Flist[0].nplex()
+        if any([F.nplex() != nplex for F in Flist]):
+            raise ValueError("Can not concatenate Formices with different plexitude")
+        nelems = [F.nelems() for F in Flist]
+        ntot = sum(nelems)
+        f = empty((ntot, nplex, 3), dtype=Float)
+        # Keep the available props: Formices without props get prop 0
+        if any([F.prop is not None for F in Flist]):
+            prop = empty(ntot, dtype=Int)
         else:
-            prop = concatenate(prop)
+            prop = None
+        i = 0
+        for F, n in zip(Flist, nelems):
+            f[i:i+n] = F.coords
+            if prop is not None:
+                prop[i:i+n] = 0 if F.prop is None else F.prop
+            i += n
 
         return Formex(f, prop, Flist[0].eltype)
 
@@ -790,21 +852,37 @@ maxprop  = %s
 
         This is also the subtraction of the current Formex with F.
         Elements are only removed if they have the same nodes in the same
-        order. This is a slow operation: for large structures, you should
-        avoid it where possible.
+        order. Every element of the Formex is compared with all elements
+        of F: for large structures, you should avoid it where possible.
         """
-        flag = ones((self.coords.shape[0],))
-        for i in range(self.coords.shape[0]):
-            for j in range(F.coords.shape[0]):
-                if allclose(self.coords[i], F.coords[j]):
-                    # element i is same as element j of F
-                    flag[i] = 0
-                    break
+        if self.coords.size == 0:
+            return self.copy()
+        flag = ones((self.coords.shape[0],), dtype=bool)
+        if F.coords.size > 0:
+            # compare the elements as flat rows of coordinates
+            a = self.coords.reshape(self.coords.shape[0], -1)
+            b = F.coords.reshape(F.coords.shape[0], -1)
+            # same tolerances as isclose: atol=1.e-8, rtol=1.e-5
+            tol = 1.e-8 + 1.e-5 * abs(b)
+            # compare tiles of elements of self and F at once, keeping
+            # the temporary arrays small enough to stay in the cache
+            size = 2**16 // a.shape[1]
+            bm = min(max(1, int(sqrt(size))), b.shape[0])
+            bn = max(1, size // bm)
+            for i in range(0, a.shape[0], bn):
+                for j in range(0, b.shape[0], bm):
+                    if not flag[i:i+bn].any():
+                        # all elements of this tile already removed
+                        break
+                    d = a[i:i+bn, newaxis] - b[j:j+bm]
+                    absolute(d, out=d)
+                    same = (d <= tol[j:j+bm]).all(axis=-1)
+                    flag[i:i+bn] &= ~same.any(axis=-1)
         if self.prop is None:
             p = None
         else:
-            p = self.prop[flag>0]
-        return Formex(self.coords[flag>0], p, self.eltype)
+            p = self.prop[flag]
+        return Formex(self.coords[flag], p, self.eltype)
 
 
     @utils.deprecated_by('Formex.withProp','Formex.selectProp')
@@ -830,9 +908,11 @@ maxprop  = %s
         If permutations is set False, two elements are not considered equal
         if one's points are a permutation of the other's.
         """
-        M = self.toMesh(rtol=rtol, atol=atol)
-        ind, ok = M.elems.testDuplicate()
-        return self.select(ind[ok])
+        from pyformex.connectivity import Connectivity
+        # Only the connectivity of the fused points is needed: no Mesh
+        x, e = self.fuse(rtol=rtol, atol=atol)
+        ind, ok = Connectivity(e).testDuplicate(permutations=permutations)
+        return self._select(ind[ok])
 
     # REMOVED IN 1.0.0
     ## unique = removeDuplicate
@@ -872,13 +952,12 @@ maxprop  = %s
         if min is None and max is None:
             raise ValueError("At least one of min or max have to be specified.")
 
+        # Perform the test on the selected nodes
         if isinstance(nodes, str):
-            nod = arange(self.nplex())
+            # all nodes: no need to make a copy
+            X = self.coords
         else:
-            nod = nodes
-
-        # Perform the test on the selected nodes
-        X = self.coords[:, nod]
+            X = self.coords[:, nodes]
         T = X.test(dir=dir, min=min, max=max, atol=atol)
 
         if len(T.shape) > 1:
@@ -1009,9 +1088,9 @@ maxprop  = %s
         The original Formex is the first of the n replicas.
         """
         n = int(n)
-        f = array( [ self.coords for i in range(n) ] )
-        for i in range(1, n):
-            f[i,:,:, dir] += i*step
+        f = empty((n,)+self.coords.shape, dtype=Float)
+        f[:] = self.coords
+        f[1:, ..., dir] += (arange(1, n)*step).astype(Float)[:, newaxis, newaxis]
         f.shape = (f.shape[0]*f.shape[1], f.shape[2], f.shape[3])
         ## the replication of the properties is automatic!
         return Formex(f, self.prop, self.eltype)
@@ -1024,12 +1103,19 @@ maxprop  = %s
         bias, taper : extra step and extra number of generations in direction
         d1 for each generation in direction d2
         """
-        P = [ self.translatem((d1, i*bias), (d2, i*t2)).replic(n1+i*taper, t1, d1)
-              for i in range(n2) ]
-        ## We should replace the Formex concatenation here by
-        ## separate data and prop concatenations, because we are
-        ## guaranteed that either none or all formices in P have props.
-        return Formex.concatenate(P)
+        # number of replicas in each generation in direction d2
+        n = maximum(int(n1) + arange(int(n2)) * taper, 0)
+        # generation number i and replica number j of all the copies
+        i = arange(len(n)).repeat(n)
+        j = arange(n.sum()) - (cumsum(n) - n).repeat(n)
+        # translation vector of all the copies
+        t = zeros((len(i), 3), dtype=Float)
+        t[:, d1] += j*t1 + i*bias
+        t[:, d2] += i*t2
+        f = self.coords[newaxis] + t[:, newaxis, newaxis]
+        f.shape = (f.shape[0]*f.shape[1], f.shape[2], f.shape[3])
+        ## the replication of the properties is automatic!
+        return Formex(f, self.prop, self.eltype)
 
 
     def replicm(self,n,t=(1.0,1.0,1.0),d=(0,1,2)):
@@ -1054,13 +1140,14 @@ maxprop  = %s
         point must be given as a list (or array) of three coordinates.
         The original Formex is the first of the n replicas.
         """
-        f = self.coords - point
-        f = array( [ f for i in range(n) ] )
-        for i in range(1, n):
-            m = array(rotationMatrix(i*angle, axis))
-            f[i] = dot(f[i], m)
-        f.shape = (f.shape[0]*f.shape[1], f.shape[2], f.shape[3])
-        return Formex(f + point, self.prop, self.eltype)
+        n = int(n)
+        # rotate over all angles at once with a stack of rotation matrices
+        m = rotationMatrices(arange(n)*angle, unitVector(axis)).astype(Float)
+        f = dot(self.coords - point, m)
+        f = f.transpose(2, 0, 1, 3).copy()
+        f.shape = (-1, self.coords.shape[1], 3)
+        f += point
+        return Formex(f, self.prop, self.eltype)
 
     ros = rosette
 
@@ -1438,7 +1525,8 @@ def intersectionLinesWithPlane(F,p,n,atol=1.e-4):
     F1 = F21 = F22 = F31 = F32 = F41 = F42= F43 = Formex(empty((0, 2, 3,), dtype=float))
     # Create a Formex with the edges
     C = Formex.concatenate([ F.selectNodes(e) for e in [[0, 1], [1, 2], [2, 0]] ])
-    t = C.intersectionWithPlane(p, n)
+    from pyformex.geomtools import intersectionTimesSWP
+    t = intersectionTimesSWP(C.coords, p.reshape(-1, 3), n.reshape(-1, 3)).reshape(-1)
     P = pointsAt(C, t)
     t = t.reshape(3, -1).transpose()
     Pb = P.reshape(3, -1, 3).swapaxes(0, 1)
@@ -1448,33 +1536,34 @@ def intersectionLinesWithPlane(F,p,n,atol=1.e-4):
     t2 = t <= 1.-atol
     t3 = t >= 0.-atol
     t4 = t <= 1.+atol
-    Tb = t1 * t2
-    Tf = (1-t1).astype(bool)*t3
-    Ts = (1-t2).astype(bool)*t4
+    # classify the intersections with boolean operations only
+    Tb = t1 & t2
+    Tf = ~t1 & t3
+    Ts = ~t2 & t4
     Nb = Tb.sum(axis=-1)
     Nf = Tf.sum(axis=-1)
     Ns = Ts.sum(axis=-1)
     # Get the triangles with 2 edge intersections
-    w1 = where(Nb==2)[0]
-    if w1.size > 0:
+    w1 = Nb==2
+    if w1.any():
         P = Pb[w1][Tb[w1]].reshape(-1, 2, 3)
         F1 = Formex(P)
     # Get the triangles with 1 edge intersection and 1 vertex intersection
-    w21 = where( (Nb==1) * (Nf==1) * (Ns==0) )[0]
-    if w21.size > 0:
+    w21 = (Nb==1) & (Nf==1) & (Ns==0)
+    if w21.any():
         P1 = Pb[w21][Tb[w21]].reshape(-1, 1, 3)
         P2 = Pf[w21][Tf[w21]].reshape(-1, 1, 3)
         P = column_stack([P1, P2])
         F21 = Formex(P)
-    w22 = where( (Nb==1) * (Nf==0) * (Ns==1) )[0]
-    if w22.size > 0:
+    w22 = (Nb==1) & (Nf==0) & (Ns==1)
+    if w22.any():
         P1 = Pb[w22][Tb[w22]].reshape(-1, 1, 3)
         P2 = Ps[w22][Ts[w22]].reshape(-1, 1, 3)
         P = column_stack([P1, P2])
         F22 = Formex(P)
     # Get the triangles with 1 edge intersection and 2 vertex intersections
-    w3 = where( (Nb==1) * (Nf==1) * (Ns==1) )[0]
-    if w3.size > 0:
+    w3 = (Nb==1) & (Nf==1) & (Ns==1)
+    if w3.any():
         Tb3 = Tb[w3]
         Tf3 = Tf[w3]
         Ts3 = Ts[w3]
@@ -1482,43 +1571,72 @@ def intersectionLinesWithPlane(F,p,n,atol=1.e-4):
         Pf3 = Pf[w3]
         Ps3 = Ps[w3]
         i = where(Ts3)[1] - where(Tf3)[1]
-        w31 = where((i == 1)+(i==-2))[0] # different vertices
-        if w31.size > 0:
+        w31 = (i == 1) | (i == -2) # different vertices
+        if w31.any():
             P1 = Pf3[w31][Tf3[w31]].reshape(-1, 1, 3)
             P2 = Ps3[w31][Ts3[w31]].reshape(-1, 1, 3)
             P = column_stack([P1, P2])
             F32 = Formex(P)
-        w32 = where((i == -1)+(i==2))[0] # equal vertices
-        if w32.size > 0:
+        w32 = (i == -1) | (i == 2) # equal vertices
+        if w32.any():
             P1 = Pb3[w32][Tb3[w32]].reshape(-1, 1, 3)
             P2 = Pf3[w32][Tf3[w32]].reshape(-1, 1, 3)
             P = column_stack([P1, P2])
             F31 = Formex(P)
     # Get the triangles with 0 edge intersections and 2 or 3 vertex intersections
-    w41 = where( (Nb==0) * (Nf==2) )[0]
-    if w41.size > 0:
+    w41 = (Nb==0) & (Nf==2)
+    if w41.any():
         P = Pf[w41][Tf[w41]].reshape(-1, 2, 3)
         F41 = Formex(P)
-    w42 = where( (Nb==0) * (Ns==2) )[0]
-    if w42.size > 0:
+    w42 = (Nb==0) & (Ns==2)
+    if w42.any():
         P = Ps[w42][Ts[w42]].reshape(-1, 2, 3)
         F42 = Formex(P)
-    w43 = where( (Nb==0) * (Nf==1) * (Ns==1) )[0]
-    if w43.size > 0:
+    w43 = (Nb==0) & (Nf==1) & (Ns==1)
+    if w43.any():
         Tf43 = Tf[w43]
         Ts43= Ts[w43]
         Pf43 = Pf[w43]
         Ps43 = Ps[w43]
         i = where(Ts43)[1] - where(Tf43)[1]
-        w43 = where((i == 1)+(i==-2))[0] # different vertices
-        if w43.size > 0:
+        w43 = (i == 1) | (i == -2) # different vertices
+        if w43.any():
             P1 = Pf43[w43][Tf43[w43]].reshape(-1, 1, 3)
             P2 = Ps43[w43][Ts43[w43]].reshape(-1, 1, 3)
             P = column_stack([P1, P2])
             F43 = Formex(P)
-    # join all the pieces
-    Ft = F1 + F21 + F22 + F31 + F32 + F41 + F42+ F43
-    return Ft
+    # join all the pieces at once
+    return Formex.concatenate([F1, F21, F22, F31, F32, F41, F42, F43])
+
+
+def _extend(a, b, buf):
+    """_Return array a extended with the rows of array b_
+
+    buf is None or the (buffer,length) tuple returned by a previous call.
+    If a is still the array returned by that call, b is stored in the
+    spare space of the buffer if it fits. Otherwise a new buffer is
+    created, with room for growth if a itself resulted from a previous
+    extension. This makes repeated extension amortized linear in time.
+
+    Returns the extended array (a view in the buffer) and the new
+    (buffer,length) tuple.
+    """
+    if b.shape[1:] != a.shape[1:]:
+        raise ValueError("Can not extend array of shape %s with shape %s" % (a.shape, b.shape))
+    n, m = a.shape[0], b.shape[0]
+    if buf is not None and buf[1] == n and a.flags.c_contiguous and \
+       a.ctypes.data == buf[0].ctypes.data and \
+       a.shape[1:] == buf[0].shape[1:] and a.dtype == buf[0].dtype:
+        buf = buf[0]
+        if n+m > buf.shape[0]:
+            new = empty((2*(n+m),)+a.shape[1:], dtype=a.dtype).view(type(a))
+            new[:n] = a
+            buf = new
+    else:
+        buf = empty((n+m,)+a.shape[1:], dtype=a.dtype).view(type(a))
+        buf[:n] = a
+    buf[n:n+m] = b
+    return buf[:n+m], (buf, n+m)
 
 
 def _sane_side(side):
@@ -1569,11 +1687,12 @@ def cut2AtPlane(F,p,n,side='',atol=None,newprops=None):
     dist = F.distanceFromPlane(p, n)
     if atol is None:
         atol = 1.e-5*dist.max()
-    above = sum(dist>atol, -1)
-    below = sum(dist<-atol, -1)
-    A = F.clip(below==0)
-    B = F.clip(above==0)
-    cutting = (above>0)*(below>0)
+    # flag the elements with a point above/below the plane
+    above = (dist > atol).any(axis=-1)
+    below = (dist < -atol).any(axis=-1)
+    A = F.clip(~below)
+    B = F.clip(~above)
+    cutting = above & below
     if newprops:
        A.setProp(newprops[0])
        B.setProp(newprops[1])
@@ -1585,8 +1704,10 @@ def cut2AtPlane(F,p,n,side='',atol=None,newprops=None):
         G = F.clip(cutting)
         H = G.copy()
 
-        g = G.intersectionWithPlane(p, n)
+        # The intersection points follow directly from the distances
         dist = dist[cutting]
+        t = dist[:, 0] / (dist[:, 0] - dist[:, 1])
+        g = G.coords[:, 0] + t[:, newaxis] * (G.coords[:, 1] - G.coords[:, 0])
         i0 = dist[:, 0] < 0.
         i1 = dist[:, 1] < 0.
         G[i0, 0,:] = H[i0, 1,:] = g[i0].reshape(-1, 3)
@@ -1659,24 +1780,35 @@ def cut3AtPlane(F,p,n,side='',atol=None,newprops=None):
     p = asarray(p).reshape(-1, 3)
     n = asarray(n).reshape(-1, 3)
     nplanes = len(p)
-    test = stack([F.test('any', n[i], p[i], atol=atol) for i in range(nplanes)]).all(axis=0) # elements having part at positive side of all planes
+    # extreme distances of the element vertices from all planes
+    if nplanes == 1:
+        # single plane: avoid the extra planes axis
+        d = F.coords.distanceFromPlane(p[0], n[0])
+        dmin, dmax = d.min(axis=1), d.max(axis=1)
+    else:
+        nn = normalize(n)
+        d = inner(F.coords, nn) - (p*nn).sum(axis=-1)
+        dmin, dmax = d.min(axis=1).min(axis=-1), d.max(axis=1).min(axis=-1)
+    test = dmax > -atol # elements having part at positive side of all planes
     F_pos = F.clip(test) # save elements having part at positive side of all planes
     if side in '-': # Dirty trick: this also includes side='' !
         F_neg = F.cclip(test) # save elements completely at negative side of one of the planes
     else:
         F_neg = None
     if F_pos.nelems() != 0:
-        test = stack([F_pos.test('all', n[i], p[i], atol=-atol) for i in range(nplanes)]).all(axis=0) # elements completely at positive side of all planes
+        d = d[test]
+        test = dmin[test] > atol # elements completely at positive side of all planes
         F_cut = F_pos.cclip(test) # save elements that will be cut by one of the planes
         F_pos = F_pos.clip(test)  # save elements completely at positive side of all planes
         if F_cut.nelems() != 0:
             if nplanes == 1:
+                d = d[~test] # reuse the distances of the elements to cut
                 if side == '+':
-                    F_pos += cutElements3AtPlane(F_cut, p[i], n[i], newprops, side, atol)
+                    F_pos += cutElements3AtPlane(F_cut, p[0], n[0], newprops, side, atol, d)
                 elif side == '-':
-                    F_neg += cutElements3AtPlane(F_cut, p[i], n[i], newprops, side, atol)
+                    F_neg += cutElements3AtPlane(F_cut, p[0], n[0], newprops, side, atol, d)
                 elif side == '':
-                    cut_pos, cut_neg = cutElements3AtPlane(F_cut, p[i], n[i], newprops, side, atol)
+                    cut_pos, cut_neg = cutElements3AtPlane(F_cut, p[0], n[0], newprops, side, atol, d)
                     F_pos += cut_pos
                     F_neg += cut_neg
             elif nplanes > 1:
@@ -1702,7 +1834,7 @@ def cut3AtPlane(F,p,n,side='',atol=None,newprops=None):
     return _select_side(side, [ F_pos, F_neg ])
 
 
-def cutElements3AtPlane(F,p,n,newprops=None,side='',atol=0.):
+def cutElements3AtPlane(F,p,n,newprops=None,side='',atol=0.,dist=None):
     """This function needs documentation.
 
     Should it be called by the user? or only via cut3AtPlane?
@@ -1710,6 +1842,8 @@ def cutElements3AtPlane(F,p,n,newprops=None,side='',atol=0.):
 
     newprops should be a list of 7 values: each an integer or None
     side is either '+', '-' or ''
+    dist are the distances of the vertices from the plane, if they
+    were already computed by the caller
     """
     if atol is None:
         atol = 1.e-5*F.dsize()
@@ -1743,7 +1877,10 @@ def cutElements3AtPlane(F,p,n,newprops=None,side='',atol=0.):
     P = stack([r[1] for r in res], axis=1)
     del res
     T = (t >= 0.)*(t <= 1.)
-    d = F.coords.distanceFromPlane(p, n)
+    if dist is None:
+        d = F.coords.distanceFromPlane(p, n)
+    else:
+        d = dist
     U = abs(d) < atol
     V = U.sum(axis=-1) # number of vertices with |distance| < atol
     F1_pos = F2_pos = F3_pos = F4_pos = F5_pos = F6_pos = F7_pos = F1_neg = F2_neg = F3_neg = F4_neg = F5_neg = F6_neg = F7_neg = Formex()
@@ -1768,14 +1905,14 @@ def cutElements3AtPlane(F,p,n,newprops=None,side='',atol=0.):
             F11 = F1[w11]
             if side in '+':
                 v1 = where(T11[:, 0]*T11[:, 2] == 1, 0, where(T11[:, 0]*T11[:, 1] == 1, 1, 2))
-                K1 = asarray([F11[j, v1[j]] for j in range(shape(F11)[0])]).reshape(-1, 1, 3)
+                K1 = F11[arange(len(F11)), v1].reshape(-1, 1, 3)
                 E1_pos = column_stack([P11, K1])
                 F1_pos = Formex(E1_pos, get_new_prop(p1, w11, newprops[0]))
             if side in '-': #quadrilateral at negative side after cut
                 v2 = where(T11[:, 0]*T11[:, 2] == 1, 2, where(T11[:, 0]*T11[:, 1] == 1, 2, 0))
                 v3 = where(T11[:, 0]*T11[:, 2] == 1, 1, where(T11[:, 0]*T11[:, 1] == 1, 0, 1))
-                K2 = asarray([F11[j, v2[j]] for j in range(shape(F11)[0])]).reshape(-1, 1, 3)
-                K3 = asarray([F11[j, v3[j]] for j in range(shape(F11)[0])]).reshape(-1, 1, 3)
+                K2 = F11[arange(len(F11)), v2].reshape(-1, 1, 3)
+                K3 = F11[arange(len(F11)), v3].reshape(-1, 1, 3)
                 E2_neg = column_stack([P11, K2])
                 F2_neg = Formex(E2_neg, get_new_prop(p1, w11, newprops[1]))
                 E3_neg = column_stack([P11[:, 0].reshape(-1, 1, 3), K2, K3])
@@ -1788,15 +1925,15 @@ def cutElements3AtPlane(F,p,n,newprops=None,side='',atol=0.):
             if side in '+':
                 v2 = where(T12[:, 0]*T12[:, 2] == 1, 2, where(T12[:, 0]*T12[:, 1] == 1, 2, 0))
                 v3 = where(T12[:, 0]*T12[:, 2] == 1, 1, where(T12[:, 0]*T12[:, 1] == 1, 0, 1))
-                K2 = asarray([F12[j, v2[j]] for j in range(shape(F12)[0])]).reshape(-1, 1, 3)
-                K3 = asarray([F12[j, v3[j]] for j in range(shape(F12)[0])]).reshape(-1, 1, 3)
+                K2 = F12[arange(len(F12)), v2].reshape(-1, 1, 3)
+                K3 = F12[arange(len(F12)), v3].reshape(-1, 1, 3)
                 E2_pos = column_stack([P12, K2])
                 F2_pos = Formex(E2_pos, get_new_prop(p1, w12, newprops[1]))
                 E3_pos = column_stack([P12[:, 0].reshape(-1, 1, 3), K2, K3])
                 F3_pos = Formex(E3_pos, get_new_prop(p1, w12, newprops[2]))
             if side in '-': # triangle at negative side after cut
                 v1 = where(T12[:, 0]*T12[:, 2] == 1, 0, where(T12[:, 0]*T12[:, 1] == 1, 1, 2))
-                K1 = asarray([F12[j, v1[j]] for j in range(shape(F12)[0])]).reshape(-1, 1, 3)
+                K1 = F12[arange(len(F12)), v1].reshape(-1, 1, 3)
                 E1_neg = column_stack([P12, K1])
                 F1_neg = Formex(E1_neg, get_new_prop(p1, w12, newprops[0]))
     # One vertex with |distance| < atol
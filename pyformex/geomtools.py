@@ -242,8 +242,8 @@ def intersectLineWithLine(q1,m1,q2,m2,mode='all',times=False):
     >>> t1,t2 = intersectLineWithLine(q,m,p,n,times=True)
     >>> print(t1)
     [[  2.  -0.]
-     [  2.  -0.]
-     [ nan  -0.]]
+     [  2.   0.]
+     [ nan   0.]]
     >>> print(t2)
     [[ -0.  -0.]
      [  2.   1.]
@@ -251,7 +251,7 @@ def intersectLineWithLine(q1,m1,q2,m2,mode='all',times=False):
 
     >>> t1,t2 = intersectLineWithLine(q[:2],m[:2],p,n,mode='pair',times=True)
     >>> print(t1)
-    [ 2. -0.]
+    [ 2.  0.]
     >>> print(t2)
     [-0.  1.]
 
@@ -272,12 +272,12 @@ def intersectLineWithLine(q1,m1,q2,m2,mode='all',times=False):
     dot12 = dotpr(m1, m2)
     denom = (dot12**2-dot11*dot22)
     q12 = q2-q1
-    dot11 = dot11[..., newaxis]
-    dot22 = dot22[..., newaxis]
-    dot12 = dot12[..., newaxis]
+    # expand the dot products to avoid (...,3) shaped temporaries
+    dot1 = dotpr(q12, m1)
+    dot2 = dotpr(q12, m2)
     errh = seterr(divide='ignore', invalid='ignore')
-    t1 = dotpr(q12, m2*dot12-m1*dot22) / denom
-    t2 = dotpr(q12, m2*dot11-m1*dot12) / denom
+    t1 = (dot2*dot12-dot1*dot22) / denom
+    t2 = (dot2*dot11-dot1*dot12) / denom
     seterr(**errh)
     if times:
         return t1, t2
@@ -1542,14 +1542,17 @@ def rotationAngle(A,B,m=None,angle_spec=DEG):
         A = normalize(A)
         B = normalize(B)
         n = cross(A, B) # vectors perpendicular to A and B
-        t = length(n) == 0.
+        l = length(n)
+        t = l == 0.
         if t.any(): # some vectors A and B are parallel
             if A.shape[0] >=  B.shape[0]:
                 temp = A[t]
             else:
                 temp = B[t]
             n[t] = anyPerpendicularVector(temp)
-        n = normalize(n)
+            l[t] = length(n[t])
+        # normalize with the lengths computed above
+        n /= l[:, newaxis]
         c = dotpr(A, B)
         angle = arccosd(c.clip(min=-1., max=1.), angle_spec)
         return angle, n
@@ -29,6 +29,7 @@ from pyformex import zip
 
 from pyformex.opengl.colors import *
 from pyformex.utils import stuur
+import numpy as np
 
 # predefined color palettes
 Palette = {
@@ -46,6 +47,27 @@ Palette = {
     'WB': [ white, grey(0.5), black ],
 }
 
+
+def stuurArray(x,xval,yval,exp=2.5):
+    """Returns a (non)linear response on the input array x.
+
+    This is a vectorized version of :func:`utils.stuur`, computing
+    the response for all the values in x at once.
+    Returns a float array with the same shape as x.
+    """
+    xmin, x0, xmax = xval
+    ymin, y0, ymax = yval
+    x = np.asarray(x, dtype=float)
+    below = x < x0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        xr = np.where(below, (x-x0) / (xmin-x0), (x-x0) / (xmax-x0))
+    xr = np.clip(np.nan_to_num(xr), 0., 1.) ** exp
+    y = np.where(below, y0 + (ymin-y0) * xr, y0 + (ymax-y0) * xr)
+    y[x < xmin] = ymin
+    y[x >= xmax] = ymax
+    return y
+
+
 class ColorScale(object):
     """Mapping floating point values into colors.
 
@@ -140,6 +162,36 @@ class ColorScale(object):
         return tuple( [ (1.-x)*p + x*q for p, q in zip(c0, c1) ] )
 
 
+    def scaleArray(self, val):
+        """Scale an array of values to the range -1...1.
+
+        This is a vectorized version of :meth:`scale`.
+        Returns a float array with the same shape as val.
+        """
+        if self.exp2 is None:
+            return stuurArray(val, [self.xmin, self.x0, self.xmax], [-1., 0., 1.], self.exp)
+
+        val = np.asarray(val, dtype=float)
+        return np.where(val < self.x0,
+            stuurArray(val, [self.xmin, (self.x0+self.xmin)/2, self.x0], [-1., -0.5, 0.], self.exp2),
+            stuurArray(val, [self.x0, (self.x0+self.xmax)/2, self.xmax], [0., 0.5, 1.0], 1./self.exp))
+
+
+    def colors(self, val):
+        """Return the colors representing an array of values val.
+
+        This is a vectorized version of :meth:`color`, mapping all
+        values at once.
+        Returns a float array with shape val.shape + (3,), holding the
+        RGB values in the range 0-1.
+        """
+        x = self.scaleArray(val)[..., np.newaxis]
+        palet = np.array(self.palet, dtype=float)
+        c1 = np.where(x < 0., palet[0], palet[2])
+        x = np.abs(x)
+        return (1.-x)*palet[1] + x*c1
+
+
 class ColorLegend(object):
     """A colorlegend divides a in a number of subranges.
 
@@ -279,14 +279,20 @@ def Grid(nx=(1, 1, 1),ox=(0.0, 0.0, 0.0),dx=(1.0, 1.0, 1.0),lines='b',planes='b'
                         M = M.replic(n2+1,dir=2,step=d2)
                 P.append(M.rollAxes(-i).toMesh())
             if lines != 'n':
-                M = Formex('1').scale(n0*d0).replic(n1+1,dir=1,step=d1) + \
-                    Formex('2').scale(n1*d1).replic(n0+1,dir=0,step=d0)
+                # Create all line end points at once
+                z = [0.]
                 if n2:
                     if lines == 'b':
-                        M = M.replic(2,dir=2,step=n2*d2)
+                        z = [0., n2*d2]
                     elif lines == 'a':
-                        M = M.replic(n2+1,dir=2,step=d2)
-
+                        z = d2*np.arange(n2+1)
+                X = np.zeros((len(z),n0+n1+2,2,3))
+                X[:,:n1+1,1,0] = n0*d0
+                X[:,:n1+1,:,1] = d1*np.arange(n1+1)[:,np.newaxis]
+                X[:,n1+1:,:,0] = d0*np.arange(n0+1)[:,np.newaxis]
+                X[:,n1+1:,1,1] = n1*d1
+                X[...,2] = np.reshape(z,(-1,1,1))
+                M = Formex(X.reshape(-1,2,3))
                 L.append(M.rollAxes(-i).toMesh())
 
     if P:
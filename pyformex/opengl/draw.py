@@ -356,10 +356,10 @@ def draw(F,
         actors = []
 
         # loop over the objects
-        for F in FL:
+        for Fi in FL:
 
             # Create the actor
-            actor = F.actor(**kargs)
+            actor = Fi.actor(**kargs)
             if single and len(actors) > 0:
                 # append the new actor to the children of the first
                 actors[0].children.append(actor)
@@ -272,7 +272,8 @@ class Drawable(Attributes):
                 #curshape = self.texcoords.shape
                 self.texcoords = at.multiplex(self.texcoords, self.object.nelems(),axis=-2)
                 #print("Multiplexing texture coords: %s -> %s " % (curshape, self.texcoords.shape))
-        self.tbo = VBO(self.texcoords.astype(float32))
+        # The texture coordinates are never changed: keep them on the GPU
+        self.tbo = VBO(self.texcoords.astype(float32), usage=GL.GL_STATIC_DRAW)
         self.texture.activate()
 
 
@@ -634,7 +635,8 @@ class Actor(BaseActor):
 
         # Currently do everything in Formex model
         # And we always need this one
-        self.vbo = VBO(self.fcoords)
+        # The coords are uploaded once: a change of coords creates a new VBO
+        self.vbo = VBO(self.fcoords, usage=GL.GL_STATIC_DRAW)
         #print("GEOM SHAPE %s" % str(self.fcoords.shape))
 
 
@@ -817,7 +819,11 @@ class Actor(BaseActor):
         """
         #if renderer.canvas.settings.lighting:
         if True:
-            if canvas.settings.avgnormals:
+            normals = getattr(self.object, 'normals', None)
+            if isinstance(normals, np.ndarray) and normals.shape == self.fcoords.shape:
+                # Use the normals set on the object (see Mesh.setNormals)
+                normals = normals.astype(float32)
+            elif canvas.settings.avgnormals:
                 normals = self.b_avgnormals
             else:
                 normals = self.b_normals
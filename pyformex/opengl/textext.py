@@ -122,7 +122,9 @@ class FontTexture(Texture):
 
         If `char` is a string of length `ntext`, returns a float array with shape
         (ntext,4,2) holding the texture coordinates needed to display
-        the given text on a grid of quad4 elements.
+        the given text on a grid of quad4 elements. All characters outside
+        the printable ASCII range (control characters as well as non-ASCII
+        characters) get the texture coordinates of character 127.
         """
         if at.isInt(char):
             dx,dy = 1./16,1./6
@@ -131,7 +133,22 @@ class FontTexture(Texture):
             return (x0,y0+dy), (x0+dx,y0+dy), (x0+dx,y0), (x0,y0)
 
         else:
-            return np.array([ self.texCoords(ord(c)) for c in char ])
+            # lookup the ordinals of all characters at once in the table
+            if not isinstance(char,unicode):
+                # a byte string (Python 2)
+                char = char.decode('latin1')
+            k = np.frombuffer(char.encode('utf-32-le'),dtype=np.uint32)
+            k = np.where((k<32)|(k>127),127,k)
+            return FontTexture._texcoords[k-32]
+
+
+    # Texture coordinates of the characters 32..127, computed once.
+    # The layout of the texture (16 x 6 characters) does not depend
+    # on the font.
+    _texcoords = np.array([
+        ((x0,y0+1./6), (x0+1./16,y0+1./6), (x0+1./16,y0), (x0,y0))
+        for x0,y0 in zip(np.arange(96)%16/16., np.arange(96)//16/6.) ],
+                          dtype=at.Float)
 
 
     default_font = None
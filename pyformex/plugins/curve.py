@@ -1645,6 +1645,32 @@ class BezierSpline(Curve):
         return T
 
 
+    def sub_points_2(self, t, j):
+        """Return the points at values,parts given by zip(t,j)
+
+        This evaluates all the points at once, collecting the control
+        points of the parts j in a single (n,degree+1,3) array.
+        """
+        d = arange(self.degree+1)
+        P = self.coords[self.degree * asarray(j).reshape(-1, 1) + d]
+        U = asarray(t).reshape(-1, 1) ** d
+        return einsum('nk,nkj->nj', dot(U, asarray(self.coeffs)), P)
+
+
+    def sub_directions_2(self, t, j):
+        """Return the unit direction vectors at values,parts given by zip(t,j)
+
+        This evaluates all the directions at once, collecting the control
+        points of the parts j in a single (n,degree+1,3) array.
+        """
+        d = arange(self.degree+1)
+        P = self.coords[self.degree * asarray(j).reshape(-1, 1) + d]
+        U = zeros((P.shape[0], self.degree+1))
+        U[:, 1:] = d[1:] * asarray(t).reshape(-1, 1) ** d[:-1]
+        T = einsum('nk,nkj->nj', dot(U, asarray(self.coeffs)), P)
+        return normalize(T)
+
+
     def sub_curvature(self, t, j):
         """Return the curvature at values t in part j."""
         P = self.part(j)
@@ -68,6 +68,25 @@ def resizeImage(image,w=0,h=0):
     return image
 
 
+def imageBuffer(image):
+    """Return a read-only view on the pixel data of a QImage.
+
+    Parameters:
+
+    - `image`: a QImage.
+
+    Returns a 1D uint8 array sharing its memory with the QImage data,
+    including any padding at the end of the scanlines. No data are
+    copied. The array does not keep the QImage alive: the caller should
+    either keep a reference to `image` or copy the data before the QImage
+    is deleted.
+    """
+    buf = image.constBits()
+    if not pf.options.pyside:
+        buf.setsize(image.numBytes())
+    return np.frombuffer(buf, dtype=np.uint8, count=image.numBytes())
+
+
 def qimage2numpy(image,resize=(0, 0),order='RGBA',flip=True,indexed=None,expand=None):
     """Transform an image to a Numpy array.
 
@@ -140,11 +159,9 @@ def qimage2numpy(image,resize=(0, 0),order='RGBA',flip=True,indexed=None,expand=
     if image.format() in (QImage.Format_ARGB32_Premultiplied,
                           QImage.Format_ARGB32,
                           QImage.Format_RGB32):
-        buf = image.bits()
-        if not pf.options.pyside:
-            buf = buf.asstring(image.numBytes())
-        ar = np.frombuffer(buf, dtype='ubyte', count=image.numBytes()).reshape(h, w, 4)
+        ar = imageBuffer(image).reshape(h, w, 4)
         idx = [ 'BGRA'.index(c) for c in order ]
+        # The fancy indexing makes a copy: ar no longer refers to image
         ar = ar[..., idx]
         ct = None
 
@@ -154,10 +171,7 @@ def qimage2numpy(image,resize=(0, 0),order='RGBA',flip=True,indexed=None,expand=
         ct = ct.view(np.uint8).reshape(-1, 4)
         idx = [ 'BGRA'.index(c) for c in order ]
         ct = ct[..., idx]
-        buf = image.bits()
-        if not pf.options.pyside:
-            buf = buf.asstring(image.numBytes())
-        ar = np.frombuffer(buf, dtype=np.uint8)
+        ar = imageBuffer(image)
         if ar.size % h == 0:
             ar = ar.reshape(h, -1)
             if ar.shape[1] > w:
@@ -172,6 +186,10 @@ def qimage2numpy(image,resize=(0, 0),order='RGBA',flip=True,indexed=None,expand=
             # the numpy buffer width to the correct image width.
             pf.warning("Size of image data (%s) does not match the reported dimensions: %s x %s = %s" % (ar.size, w, h, w*h))
 
+        if indexed is not False:
+            # The indices are returned as such: detach them from image
+            ar = ar.copy()
+
     else:
         raise ValueError("qimage2numpy only supports 32bit and 8bit images")
 
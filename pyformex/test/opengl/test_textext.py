@@ -0,0 +1,60 @@
+# $Id$
+##
+##  This file is part of pyFormex 1.0.2  (Thu Jun 18 15:35:31 CEST 2015)
+##  pyFormex is a tool for generating, manipulating and transforming 3D
+##  geometrical models by sequences of mathematical operations.
+##  Home page: http://pyformex.org
+##  Project page:  http://savannah.nongnu.org/projects/pyformex/
+##  Copyright 2004-2015 (C) Benedict Verhegghe (benedict.verhegghe@feops.com)
+##  Distributed under the GNU General Public License version 3 or later.
+##
+##  This program is free software: you can redistribute it and/or modify
+##  it under the terms of the GNU General Public License as published by
+##  the Free Software Foundation, either version 3 of the License, or
+##  (at your option) any later version.
+##
+##  This program is distributed in the hope that it will be useful,
+##  but WITHOUT ANY WARRANTY; without even the implied warranty of
+##  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+##  GNU General Public License for more details.
+##
+##  You should have received a copy of the GNU General Public License
+##  along with this program.  If not, see http://www.gnu.org/licenses/.
+##
+
+"""Unit tests for the pyformex.opengl.textext module
+
+These unit test are based on the pytest framework.
+
+"""
+from __future__ import print_function
+import pyformex as pf
+import numpy as np
+import pytest
+
+pytest.importorskip('OpenGL')
+from pyformex.opengl.textext import FontTexture
+
+# texCoords does not use the FontTexture instance: call it without one,
+# because creating a FontTexture requires an OpenGL context
+texCoords = getattr(FontTexture.texCoords, '__func__', FontTexture.texCoords)
+
+
+def test_texCoords():
+    """Texture coordinates of a string are those of its characters"""
+    tc = texCoords(None, u'Ab~')
+    assert tc.shape == (3, 4, 2)
+    for i, c in enumerate(u'Ab~'):
+        assert np.allclose(tc[i], texCoords(None, ord(c)))
+
+
+def test_texCoords_nonprintable():
+    """Characters outside the printable ASCII range map to character 127"""
+    tc127 = texCoords(None, 127)
+    tc = texCoords(None, u'a\n\t\xe9\u20ac')
+    assert np.allclose(tc[0], texCoords(None, ord('a')))
+    for t in tc[1:]:
+        assert np.allclose(t, tc127)
+
+
+# End
@@ -100,6 +100,18 @@ def test_niceLogSize():
     assert niceLogSize(0.4) == 0
     assert niceLogSize(0.00045676) == -3
 
+def test_rotationMatrices():
+    angles = [30., 45., 120.]
+    axes = [[0.,1.,0.],[1.,1.,0.],[1.,2.,3.]]
+    R = rotationMatrices(angles,axes)
+    assert R.shape == (3,3,3)
+    for r,a,x in zip(R,angles,axes):
+        assert isclose(r,rotationMatrix(a,x)).all()
+    R = rotationMatrices(angles,[0.,0.,1.])
+    assert isclose(R[0],rotationMatrix(30.,2)).all()
+    R = rotationMatrices(pi/6,axes,RAD)
+    assert isclose(R[2],rotationMatrix(30.,axes[2])).all()
+
 
 def test_nodalSum_Avg():
     val = np.array([
@@ -0,0 +1,108 @@
+# $Id$
+##
+##  This file is part of pyFormex 1.0.2  (Thu Jun 18 15:35:31 CEST 2015)
+##  pyFormex is a tool for generating, manipulating and transforming 3D
+##  geometrical models by sequences of mathematical operations.
+##  Home page: http://pyformex.org
+##  Project page:  http://savannah.nongnu.org/projects/pyformex/
+##  Copyright 2004-2015 (C) Benedict Verhegghe (benedict.verhegghe@feops.com)
+##  Distributed under the GNU General Public License version 3 or later.
+##
+##  This program is free software: you can redistribute it and/or modify
+##  it under the terms of the GNU General Public License as published by
+##  the Free Software Foundation, either version 3 of the License, or
+##  (at your option) any later version.
+##
+##  This program is distributed in the hope that it will be useful,
+##  but WITHOUT ANY WARRANTY; without even the implied warranty of
+##  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+##  GNU General Public License for more details.
+##
+##  You should have received a copy of the GNU General Public License
+##  along with this program.  If not, see http://www.gnu.org/licenses/.
+##
+
+"""Unit tests for the pyformex.formex module
+
+These unit test are based on the pytest framework.
+
+"""
+from __future__ import print_function
+import pyformex as pf
+import numpy as np
+import pytest
+from pyformex.formex import Formex
+
+
+def test_Formex_concatenate():
+    """Test concatenation of Formices"""
+    F = Formex('3:012', 1)
+    G = Formex('3:016')
+    H = Formex.concatenate([F, G, F])
+    assert H.shape == (3, 3, 3)
+    assert (H.coords[1] == G.coords[0]).all()
+    assert (H.prop == [1, 0, 1]).all()
+    assert Formex.concatenate([G, G]).prop is None
+
+
+def test_Formex_concatenate_errors():
+    """Concatenation of Formices with different plexitude or none fails"""
+    F = Formex([[[0., 0., 0.], [1., 0., 0.]]])
+    G = Formex([[[5., 5., 5.]]])
+    with pytest.raises(ValueError):
+        Formex.concatenate([F, G])
+    with pytest.raises(ValueError):
+        F + G
+    with pytest.raises(ValueError):
+        F.append(G)
+    assert F.shape == (1, 2, 3)
+    with pytest.raises(ValueError):
+        Formex.concatenate([])
+
+
+def test_Formex_views_copied():
+    """Formices created from views do not share data with the source"""
+    F = Formex('3:012934', [1, 2])
+    F0 = F.coords.copy()
+    G = F.reverse()
+    G.translate([1., 0., 0.], inplace=True)
+    F.split(1)[0].scale(10., inplace=True)
+    F.asPoints().translate([0., 1., 0.], inplace=True)
+    assert (F.coords == F0).all()
+
+
+def test_Formex_remove():
+    """Test removing elements from a Formex"""
+    F = Formex('3:012934', [1, 2])
+    G = F.remove(Formex(F.coords[1:]))
+    assert G.nelems() == 1
+    assert (G.coords == F.coords[0]).all()
+    assert (G.prop == [1]).all()
+    assert F.remove(Formex()).nelems() == 2
+    # removing from an empty Formex
+    E = Formex().remove(Formex('3:012'))
+    assert E.nelems() == 0
+    E = Formex(np.zeros((0, 3, 3))).remove(Formex('3:012'))
+    assert E.shape == (0, 3, 3)
+
+
+def test_Formex_add():
+    F = Formex('3:012', eltype='tri3')
+    F.attrib(color='red')
+    G = Formex('3:016', 1)
+    H = F + G
+    assert H.nelems() == 2
+    assert H.eltype == F.eltype
+    assert H.attrib['color'] == 'red'
+    E = Formex(eltype='line2')
+    E.attrib(color='blue')
+    H = E + G
+    assert H.nelems() == 1
+    assert H.eltype == E.eltype
+    assert H.attrib['color'] == 'blue'
+    assert (H.prop == G.prop).all()
+    assert not np.may_share_memory(H.coords, G.coords)
+    assert not np.may_share_memory(H.prop, G.prop)
+
+
+# End
@@ -28,6 +28,7 @@ from __future__ import absolute_import, division, print_function
 
 import os
 import re
+import shutil
 import sys
 import tempfile
 import time
@@ -1383,7 +1384,8 @@ def gzip(filename,gzipped=None,remove=True,level=5,compr='gz'):
     else:
         raise ValueError("`compr` should be 'gz' or 'bz2'")
     with open(filename,'rb') as fil:
-        gz.write(fil.read())
+        # copy in chunks: the file does not need to fit in memory
+        shutil.copyfileobj(fil, gz, 1<<20)
     gz.close()
     if remove:
         removeFile(filename)
@@ -1434,7 +1436,7 @@ def gunzip(filename,unzipped=None,remove=True,compr='gz'):
     else:
         fil = tempFile(prefix='gunzip-', delete=False)
         unzipped = fil.name
-    fil.write(gz.read())
+    shutil.copyfileobj(gz, fil, 1<<20)
     gz.close()
     fil.close()
     if remove: